@@ -47,7 +47,7 @@ public static class ScanCommand
         var concurrencyOption = new Option<int>(
             name: "--concurrency",
             getDefaultValue: () => 50,
-            description: "Maximum concurrent log processing tasks (1-100)");
+            description: "Maximum concurrent log processing tasks (1-100, or 0 to scale with CPU count)");
 
         var quietOption = new Option<bool>(
             name: "--quiet",
@@ -81,9 +81,9 @@ public static class ScanCommand
             var quiet = context.ParseResult.GetValueForOption(quietOption);
 
             // Validate concurrency
-            if (concurrency < 1 || concurrency > 100)
+            if (concurrency < 0 || concurrency > 100)
             {
-                Console.Error.WriteLine("Error: --concurrency must be between 1 and 100");
+                Console.Error.WriteLine("Error: --concurrency must be between 0 and 100");
                 context.ExitCode = ExitCodes.InvalidArguments;
                 return;
             }
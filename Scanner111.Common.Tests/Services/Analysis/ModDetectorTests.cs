@@ -192,6 +192,72 @@ public class ModDetectorTests
         result.Conflicts.Should().BeEmpty();
     }
 
+    [Fact]
+    public async Task DetectAsync_WithSameConfigurationAcrossLogs_EvaluatesConflictsPerLog()
+    {
+        // Arrange
+        var conflictingPlugins = new[]
+        {
+            new PluginInfo { FormIdPrefix = "E7", PluginName = "BetterPowerArmor.esp" },
+            new PluginInfo { FormIdPrefix = "E8", PluginName = "KNOCKOUTFRAMEWORK.esp" }
+        };
+        var safePlugins = new[]
+        {
+            new PluginInfo { FormIdPrefix = "E7", PluginName = "BetterPowerArmor.esp" }
+        };
+
+        _detector.Configuration = new ModConfiguration
+        {
+            ConflictingMods = new Dictionary<string, string>
+            {
+                ["BetterPowerArmor | KnockoutFramework"] = "Conflict message"
+            }
+        };
+
+        // Act
+        var first = await _detector.DetectAsync(conflictingPlugins, new HashSet<string>());
+        var second = await _detector.DetectAsync(safePlugins, new HashSet<string>());
+        var third = await _detector.DetectAsync(conflictingPlugins, new HashSet<string>());
+
+        // Assert
+        first.Conflicts.Should().ContainSingle();
+        second.Conflicts.Should().BeEmpty();
+        third.Conflicts.Should().ContainSingle().Which.Mod2.Should().Be("knockoutframework");
+    }
+
+    [Fact]
+    public async Task DetectAsync_AfterMappingsAreMutated_UsesUpdatedMappings()
+    {
+        // Arrange
+        var plugins = new[]
+        {
+            new PluginInfo { FormIdPrefix = "E7", PluginName = "BetterPowerArmor.esp" },
+            new PluginInfo { FormIdPrefix = "E8", PluginName = "KNOCKOUTFRAMEWORK.esp" },
+            new PluginInfo { FormIdPrefix = "E9", PluginName = "DangerousMod.esp" }
+        };
+        var frequentCrashMods = new Dictionary<string, string> { ["SomeOtherMod"] = "Some Other Mod" };
+        var conflictingMods = new Dictionary<string, string> { ["BetterPowerArmor | SomeOtherMod"] = "Old conflict" };
+
+        _detector.Configuration = new ModConfiguration
+        {
+            FrequentCrashMods = frequentCrashMods,
+            ConflictingMods = conflictingMods
+        };
+        var before = await _detector.DetectAsync(plugins, new HashSet<string>());
+
+        frequentCrashMods["DangerousMod"] = "Dangerous Mod";
+        conflictingMods["BetterPowerArmor | KnockoutFramework"] = "New conflict";
+
+        // Act
+        var after = await _detector.DetectAsync(plugins, new HashSet<string>());
+
+        // Assert
+        before.ProblematicMods.Should().BeEmpty();
+        before.Conflicts.Should().BeEmpty();
+        after.ProblematicMods.Should().ContainSingle().Which.ModName.Should().Be("Dangerous Mod");
+        after.Conflicts.Should().ContainSingle().Which.Warning.Should().Be("New conflict");
+    }
+
     #endregion
 
     #region Important Mods Tests
@@ -462,5 +528,39 @@ public class ModDetectorTests
         result.ProblematicMods.Should().HaveCount(1);
     }
 
+    [Fact]
+    public async Task DetectAsync_WithOverlappingPatterns_MatchesLongestPatternFirst()
+    {
+        // Arrange - "Weapon" also appears in "WeaponOverhaul.esp", which the longer pattern claims
+        var plugins = new[]
+        {
+            new PluginInfo { FormIdPrefix = "E7", PluginName = "WeaponOverhaul.esp" },
+            new PluginInfo { FormIdPrefix = "E8", PluginName = "SafeMod.esp" },
+            new PluginInfo { FormIdPrefix = "E9", PluginName = "Weapons.esp" }
+        };
+
+        var mappings = new Dictionary<string, string>
+        {
+            ["Weapon"] = "Weapons\nShort pattern.",
+            ["WeaponOverhaul"] = "Weapon Overhaul\nLong pattern."
+        };
+        for (var i = 0; i < 50; i++)
+        {
+            mappings[$"UnusedMod{i}"] = $"Unused Mod {i}";
+        }
+
+        _detector.Configuration = new ModConfiguration { FrequentCrashMods = mappings };
+
+        // Act
+        var result = await _detector.DetectAsync(plugins, new HashSet<string>());
+
+        // Assert
+        result.ProblematicMods.Should().HaveCount(2);
+        result.ProblematicMods[0].ModName.Should().Be("Weapon Overhaul");
+        result.ProblematicMods[0].PluginFormId.Should().Be("E7");
+        result.ProblematicMods[1].ModName.Should().Be("Weapons");
+        result.ProblematicMods[1].PluginFormId.Should().Be("E9");
+    }
+
     #endregion
 }
@@ -137,6 +137,34 @@ public class RecordScannerTests
         result.RecordCounts["(WEAP) Weapon2"].Should().Be(1);
     }
 
+    [Fact]
+    public async Task ScanAsync_WithDifferentlyCasedDuplicates_CountsOnceInSortedOrder()
+    {
+        // Arrange
+        _scanner.Configuration = new RecordScannerConfiguration
+        {
+            TargetRecords = new[] { "WEAP" }
+        };
+
+        var segment = new LogSegment
+        {
+            Name = "STACK",
+            Lines = new[]
+            {
+                "(WEAP) Zebra",
+                "(WEAP) Alpha",
+                "(weap) alpha"
+            }
+        };
+
+        // Act
+        var result = await _scanner.ScanAsync(segment);
+
+        // Assert
+        result.RecordCounts.Keys.Should().Equal("(WEAP) Alpha", "(WEAP) Zebra");
+        result.RecordCounts["(WEAP) Alpha"].Should().Be(2);
+    }
+
     [Fact]
     public async Task ScanAsync_WithIgnoredRecords_FiltersThemOut()
     {
@@ -166,6 +194,35 @@ public class RecordScannerTests
         result.MatchedRecords.Should().NotContain(r => r.Contains("IgnoreThis"));
     }
 
+    [Fact]
+    public async Task ScanAsync_WithRegexMetacharactersInRecords_MatchesLiterally()
+    {
+        // Arrange
+        _scanner.Configuration = new RecordScannerConfiguration
+        {
+            TargetRecords = new[] { "Mod.esp" },
+            IgnoreRecords = new[] { "(skip)" }
+        };
+
+        var segment = new LogSegment
+        {
+            Name = "STACK",
+            Lines = new[]
+            {
+                "File: \"Mod.esp\"",
+                "File: \"ModXesp\"",
+                "File: \"Mod.esp\" (skip)"
+            }
+        };
+
+        // Act
+        var result = await _scanner.ScanAsync(segment);
+
+        // Assert
+        result.TotalMatches.Should().Be(1);
+        result.MatchedRecords.Should().ContainSingle().Which.Should().Be("File: \"Mod.esp\"");
+    }
+
     [Fact]
     public async Task ScanAsync_IsCaseInsensitive()
     {
@@ -235,4 +235,28 @@ public class SettingsScannerTests
         result.DetectedSettings.Should().ContainKey("MemoryManager");
         result.DetectedSettings["MemoryManager"].Should().Be("false");
     }
+
+    [Fact]
+    public async Task ScanAsync_WithNonSettingColonLines_SkipsThem()
+    {
+        // Arrange
+        var segment = new LogSegment
+        {
+            Name = "Compatibility",
+            Lines = new[]
+            {
+                "Buffout 4 v1.28.6: loaded",
+                "EmptyValue:   ",
+                "MemoryManager: false"
+            }
+        };
+        var expectedSettings = GameSettings.CreateFallout4Defaults();
+
+        // Act
+        var result = await _scanner.ScanAsync(segment, expectedSettings);
+
+        // Assert
+        result.DetectedSettings.Should().ContainSingle();
+        result.DetectedSettings["MemoryManager"].Should().Be("false");
+    }
 }
@@ -113,4 +113,120 @@ public class FormIdAnalyzerTests : IDisposable
         result.DetectedRecords.Should().ContainKey("00012345");
         result.DetectedRecords["00012345"].Should().Be("Iron Sword");
     }
-}
\ No newline at end of file
+
+    [Fact]
+    public async Task AnalyzeAsync_WithMultipleLines_FindsFormIdsAcrossLinesAndSkipsModules()
+    {
+        var analyzer = new FormIdAnalyzer(NullLogger<FormIdAnalyzer>.Instance, _factoryMock.Object);
+        var segments = new List<LogSegment>
+        {
+            new LogSegment
+            {
+                Name = "PROBABLE CALL STACK",
+                Lines = new[] { "  [0] Skyrim.esm+12345", "  [1] 000abcde (Form)", "  [2] 0x00012345" }
+            },
+            new LogSegment
+            {
+                Name = "Modules",
+                Lines = new[] { "  00012345 should be ignored" }
+            }
+        };
+
+        var result = await analyzer.AnalyzeAsync(segments);
+
+        result.DetectedRecords.Should().HaveCount(2);
+        result.DetectedRecords["000ABCDE"].Should().Be("Gold Coin");
+        result.DetectedRecords["00012345"].Should().Be("Iron Sword");
+    }
+
+    [Fact]
+    public async Task LookupFormIdsAsync_WithMoreIdsThanOneBatch_ReturnsMatchesFromAllBatches()
+    {
+        var analyzer = new FormIdAnalyzer(NullLogger<FormIdAnalyzer>.Instance, _factoryMock.Object);
+        var formIds = Enumerable.Range(0, 1200)
+            .Select(i => (0xF0000000 + i).ToString("X8"))
+            .Append("00012345")
+            .Prepend("000ABCDE")
+            .ToList();
+
+        var results = await analyzer.LookupFormIdsAsync(formIds);
+
+        results.Should().HaveCount(2);
+        results["00012345"].Should().Be("Iron Sword");
+        results["000ABCDE"].Should().Be("Gold Coin");
+    }
+
+    [Fact]
+    public async Task LookupFormIdsAsync_WithDuplicateIdsAcrossBatches_ReturnsEachMatchOnce()
+    {
+        var analyzer = new FormIdAnalyzer(NullLogger<FormIdAnalyzer>.Instance, _factoryMock.Object);
+        var formIds = Enumerable.Repeat("00012345", 600)
+            .Concat(Enumerable.Repeat("000ABCDE", 600))
+            .ToList();
+
+        var results = await analyzer.LookupFormIdsAsync(formIds);
+
+        results.Should().HaveCount(2);
+        results["00012345"].Should().Be("Iron Sword");
+        results["000ABCDE"].Should().Be("Gold Coin");
+    }
+
+    [Fact]
+    public async Task LookupFormIdsAsync_WithMixedCaseDuplicates_MatchesUpperCaseRecord()
+    {
+        var analyzer = new FormIdAnalyzer(NullLogger<FormIdAnalyzer>.Instance, _factoryMock.Object);
+
+        var results = await analyzer.LookupFormIdsAsync(new List<string> { "000abcde", "000ABCDE" });
+        var cached = await analyzer.LookupFormIdsAsync(new List<string> { "000ABCDE" });
+
+        results.Should().ContainSingle().Which.Value.Should().Be("Gold Coin");
+        cached["000ABCDE"].Should().Be("Gold Coin");
+    }
+
+    [Fact]
+    public async Task LookupFormIdsAsync_RepeatedLookup_ServesResultsFromCache()
+    {
+        var analyzer = new FormIdAnalyzer(NullLogger<FormIdAnalyzer>.Instance, _factoryMock.Object);
+        await analyzer.LookupFormIdsAsync(new List<string> { "00012345", "00099999" });
+
+        var results = await analyzer.LookupFormIdsAsync(new List<string> { "00012345", "00099999" });
+
+        results.Should().ContainSingle().Which.Value.Should().Be("Iron Sword");
+        _factoryMock.Verify(x => x.CreateConnectionAsync(It.IsAny<CancellationToken>()), Times.Once);
+    }
+
+    [Fact]
+    public async Task LookupFormIdsAsync_WhenDatabaseFails_StillReturnsCachedResults()
+    {
+        var analyzer = new FormIdAnalyzer(NullLogger<FormIdAnalyzer>.Instance, _factoryMock.Object);
+        await analyzer.LookupFormIdsAsync(new List<string> { "00012345" });
+
+        _factoryMock.Setup(x => x.CreateConnectionAsync(It.IsAny<CancellationToken>()))
+            .ThrowsAsync(new InvalidOperationException("Database unavailable"));
+
+        var results = await analyzer.LookupFormIdsAsync(new List<string> { "00012345", "000ABCDE" });
+
+        results.Should().ContainSingle().Which.Value.Should().Be("Iron Sword");
+    }
+
+    [Fact]
+    public async Task LookupFormIdsAsync_WhenCacheIsFull_EvictsLeastRecentlyUsedId()
+    {
+        var analyzer = new FormIdAnalyzer(NullLogger<FormIdAnalyzer>.Instance, _factoryMock.Object, maxCacheSize: 1);
+        await analyzer.LookupFormIdsAsync(new List<string> { "00012345" });
+        await analyzer.LookupFormIdsAsync(new List<string> { "000ABCDE" });
+
+        using (var command = _connection.CreateCommand())
+        {
+            command.CommandText = "UPDATE FormIDDatabase SET RecordName = 'Steel Sword' WHERE FormID = '00012345'";
+            command.ExecuteNonQuery();
+        }
+
+        var evicted = await analyzer.LookupFormIdsAsync(new List<string> { "00012345" });
+        var cached = await analyzer.LookupFormIdsAsync(new List<string> { "00012345" });
+
+        evicted["00012345"].Should().Be("Steel Sword");
+        cached["00012345"].Should().Be("Steel Sword");
+        _factoryMock.Verify(x => x.CreateConnectionAsync(It.IsAny<CancellationToken>()), Times.Exactly(3));
+    }
+}
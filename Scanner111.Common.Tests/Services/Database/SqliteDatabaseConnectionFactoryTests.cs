@@ -0,0 +1,103 @@
+using System.Data;
+using FluentAssertions;
+using Microsoft.Data.Sqlite;
+using Scanner111.Common.Services.Database;
+
+namespace Scanner111.Common.Tests.Services.Database;
+
+public class SqliteDatabaseConnectionFactoryTests : IDisposable
+{
+    private readonly string _tempDir;
+
+    public SqliteDatabaseConnectionFactoryTests()
+    {
+        _tempDir = Path.Combine(Path.GetTempPath(), $"SqliteFactoryTests_{Guid.NewGuid()}");
+        Directory.CreateDirectory(_tempDir);
+    }
+
+    public void Dispose()
+    {
+        SqliteConnection.ClearAllPools();
+
+        if (Directory.Exists(_tempDir))
+        {
+            Directory.Delete(_tempDir, recursive: true);
+        }
+    }
+
+    [Fact]
+    public async Task CreateConnectionAsync_WithSemicolonInPath_OpensReadOnlyConnection()
+    {
+        // Arrange
+        var dbPath = Path.Combine(_tempDir, "form;ids.db");
+        using (var setup = new SqliteConnection(new SqliteConnectionStringBuilder { DataSource = dbPath }.ToString()))
+        {
+            setup.Open();
+            using var command = setup.CreateCommand();
+            command.CommandText = "CREATE TABLE FormIDDatabase (FormID TEXT PRIMARY KEY, RecordName TEXT)";
+            command.ExecuteNonQuery();
+        }
+
+        var factory = new SqliteDatabaseConnectionFactory(dbPath);
+
+        // Act
+        using var connection = await factory.CreateConnectionAsync();
+
+        // Assert
+        connection.State.Should().Be(ConnectionState.Open);
+        using var write = connection.CreateCommand();
+        write.CommandText = "INSERT INTO FormIDDatabase VALUES ('00000001', 'Test')";
+        var act = () => write.ExecuteNonQuery();
+        act.Should().Throw<SqliteException>();
+    }
+
+    [Fact]
+    public async Task CreateConnectionAsync_AppliesLookupPragmas()
+    {
+        // Arrange
+        var dbPath = Path.Combine(_tempDir, "formids.db");
+        using (var setup = new SqliteConnection(new SqliteConnectionStringBuilder { DataSource = dbPath }.ToString()))
+        {
+            setup.Open();
+        }
+
+        var factory = new SqliteDatabaseConnectionFactory(dbPath);
+
+        // Act
+        using var connection = await factory.CreateConnectionAsync();
+
+        // Assert
+        ReadPragma(connection, "query_only").Should().Be(1L);
+        ReadPragma(connection, "cache_size").Should().Be(-64000L);
+    }
+
+    [Fact]
+    public async Task CreateConnectionAsync_ReopeningPooledConnection_KeepsLookupPragmas()
+    {
+        // Arrange
+        var dbPath = Path.Combine(_tempDir, "formids.db");
+        using (var setup = new SqliteConnection(new SqliteConnectionStringBuilder { DataSource = dbPath }.ToString()))
+        {
+            setup.Open();
+        }
+
+        var factory = new SqliteDatabaseConnectionFactory(dbPath);
+        using (await factory.CreateConnectionAsync())
+        {
+        }
+
+        // Act
+        using var connection = await factory.CreateConnectionAsync();
+
+        // Assert
+        ReadPragma(connection, "query_only").Should().Be(1L);
+        ReadPragma(connection, "cache_size").Should().Be(-64000L);
+    }
+
+    private static object? ReadPragma(IDbConnection connection, string name)
+    {
+        using var command = connection.CreateCommand();
+        command.CommandText = $"PRAGMA {name}";
+        return command.ExecuteScalar();
+    }
+}
@@ -37,6 +37,73 @@ public class FileIOServiceTests
         }
     }
 
+    [Fact]
+    public async Task ReadFileAsync_WithUtf8Bom_StripsBom()
+    {
+        // Arrange
+        var tempFile = Path.GetTempFileName();
+        await File.WriteAllTextAsync(tempFile, "Fallout 4 v1.10.163", new System.Text.UTF8Encoding(true));
+
+        try
+        {
+            // Act
+            var content = await _service.ReadFileAsync(tempFile);
+
+            // Assert
+            content.Should().Be("Fallout 4 v1.10.163");
+        }
+        finally
+        {
+            File.Delete(tempFile);
+        }
+    }
+
+    [Fact]
+    public async Task ReadFileAsync_AfterLargerFile_ReturnsOnlySmallerFileContent()
+    {
+        // Arrange
+        var largeFile = Path.GetTempFileName();
+        var smallFile = Path.GetTempFileName();
+        await File.WriteAllTextAsync(largeFile, new string('x', 10000));
+        await File.WriteAllTextAsync(smallFile, "small");
+
+        try
+        {
+            // Act
+            var large = await _service.ReadFileAsync(largeFile);
+            var small = await _service.ReadFileAsync(smallFile);
+
+            // Assert
+            large.Should().HaveLength(10000);
+            small.Should().Be("small");
+        }
+        finally
+        {
+            File.Delete(largeFile);
+            File.Delete(smallFile);
+        }
+    }
+
+    [Fact]
+    public async Task ReadFileAsync_WithEmptyFile_ReturnsEmptyString()
+    {
+        // Arrange
+        var tempFile = Path.GetTempFileName();
+
+        try
+        {
+            // Act
+            var content = await _service.ReadFileAsync(tempFile);
+
+            // Assert
+            content.Should().BeEmpty();
+        }
+        finally
+        {
+            File.Delete(tempFile);
+        }
+    }
+
     [Fact]
     public async Task ReadFileAsync_WithNonExistentFile_ThrowsException()
     {
@@ -99,6 +166,169 @@ public class FileIOServiceTests
         }
     }
 
+    [Fact]
+    public async Task WriteLinesAsync_JoinsLinesWithNewlines()
+    {
+        // Arrange
+        var tempFile = Path.Combine(Path.GetTempPath(), Guid.NewGuid().ToString());
+        var lines = new[] { "# Header", string.Empty, "Line 1", "Line 2" };
+
+        try
+        {
+            // Act
+            await _service.WriteLinesAsync(tempFile, lines);
+
+            // Assert
+            var writtenContent = await File.ReadAllTextAsync(tempFile);
+            writtenContent.Should().Be("# Header\n\nLine 1\nLine 2");
+        }
+        finally
+        {
+            if (File.Exists(tempFile))
+            {
+                File.Delete(tempFile);
+            }
+        }
+    }
+
+    [Fact]
+    public async Task WriteLinesAsync_OverwritingLongerFile_WritesOnlyNewMultiByteContent()
+    {
+        // Arrange
+        var tempFile = Path.GetTempFileName();
+        await File.WriteAllTextAsync(tempFile, new string('x', 500));
+        var lines = new[] { "Plugin: Café.esp", "Größe ✓" };
+
+        try
+        {
+            // Act
+            await _service.WriteLinesAsync(tempFile, lines);
+
+            // Assert
+            var writtenContent = await File.ReadAllTextAsync(tempFile);
+            writtenContent.Should().Be("Plugin: Café.esp\nGröße ✓");
+        }
+        finally
+        {
+            File.Delete(tempFile);
+        }
+    }
+
+    [Fact]
+    public async Task WriteLinesAsync_WithIdenticalContent_LeavesFileUntouched()
+    {
+        // Arrange
+        var tempFile = Path.GetTempFileName();
+        var lines = new[] { "# Report", "Line 1" };
+        await _service.WriteLinesAsync(tempFile, lines);
+        var originalTime = new DateTime(2020, 1, 1, 0, 0, 0, DateTimeKind.Utc);
+        File.SetLastWriteTimeUtc(tempFile, originalTime);
+
+        try
+        {
+            // Act
+            await _service.WriteLinesAsync(tempFile, lines);
+
+            // Assert
+            File.GetLastWriteTimeUtc(tempFile).Should().Be(originalTime);
+            (await File.ReadAllTextAsync(tempFile)).Should().Be("# Report\nLine 1");
+        }
+        finally
+        {
+            File.Delete(tempFile);
+        }
+    }
+
+    [Fact]
+    public async Task WriteLinesAsync_WithSameLengthDifferentContent_OverwritesFile()
+    {
+        // Arrange
+        var tempFile = Path.GetTempFileName();
+        await _service.WriteLinesAsync(tempFile, new[] { "# Report", "Line 1" });
+
+        try
+        {
+            // Act
+            await _service.WriteLinesAsync(tempFile, new[] { "# Report", "Line 2" });
+
+            // Assert
+            (await File.ReadAllTextAsync(tempFile)).Should().Be("# Report\nLine 2");
+        }
+        finally
+        {
+            File.Delete(tempFile);
+        }
+    }
+
+    [Fact]
+    public async Task WriteLinesAsync_OverwritingFile_LeavesNoTempFileBehind()
+    {
+        // Arrange
+        var tempDir = Path.Combine(Path.GetTempPath(), Guid.NewGuid().ToString());
+        Directory.CreateDirectory(tempDir);
+        var reportPath = Path.Combine(tempDir, "crash-AUTOSCAN.md");
+        await File.WriteAllTextAsync(reportPath, "old report content");
+
+        try
+        {
+            // Act
+            await _service.WriteLinesAsync(reportPath, new[] { "# Report", "New" });
+
+            // Assert
+            (await File.ReadAllTextAsync(reportPath)).Should().Be("# Report\nNew");
+            Directory.GetFiles(tempDir).Should().ContainSingle().Which.Should().Be(reportPath);
+        }
+        finally
+        {
+            Directory.Delete(tempDir, recursive: true);
+        }
+    }
+
+    [Fact]
+    public async Task WriteLinesAsync_WithCustomSeparator_JoinsLinesWithSeparator()
+    {
+        // Arrange
+        var tempFile = Path.Combine(Path.GetTempPath(), Guid.NewGuid().ToString());
+
+        try
+        {
+            // Act
+            await _service.WriteLinesAsync(tempFile, new[] { "A", "B", "C" }, "\r\n");
+
+            // Assert
+            (await File.ReadAllTextAsync(tempFile)).Should().Be("A\r\nB\r\nC");
+        }
+        finally
+        {
+            if (File.Exists(tempFile))
+            {
+                File.Delete(tempFile);
+            }
+        }
+    }
+
+    [Fact]
+    public async Task WriteLinesAsync_WithNoLines_CreatesEmptyFile()
+    {
+        // Arrange
+        var tempFile = Path.GetTempFileName();
+        await File.WriteAllTextAsync(tempFile, "Original content");
+
+        try
+        {
+            // Act
+            await _service.WriteLinesAsync(tempFile, Array.Empty<string>());
+
+            // Assert
+            var writtenContent = await File.ReadAllTextAsync(tempFile);
+            writtenContent.Should().BeEmpty();
+        }
+        finally
+        {
+            File.Delete(tempFile);
+        }
+    }
+
     [Fact]
     public async Task FileExistsAsync_WithExistingFile_ReturnsTrue()
     {
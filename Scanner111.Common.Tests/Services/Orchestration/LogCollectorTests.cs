@@ -222,6 +222,22 @@ public class LogCollectorTests : IDisposable
         result.HasErrors.Should().BeFalse();
     }
 
+    [Fact]
+    public async Task MoveUnsolvedLogsAsync_WithDuplicatePaths_MovesEachLogOnce()
+    {
+        // Arrange
+        var path = Path.Combine(_testDirectory, "crash-dup.log");
+        await File.WriteAllTextAsync(path, "Content");
+        var relativeDuplicate = Path.Combine(_testDirectory, ".", "crash-dup.log");
+
+        // Act
+        var result = await _collector.MoveUnsolvedLogsAsync(new[] { path, path, relativeDuplicate });
+
+        // Assert
+        result.MovedCrashLogs.Should().ContainSingle().Which.Should().Be("crash-dup.log");
+        result.HasErrors.Should().BeFalse();
+    }
+
     [Fact]
     public async Task MoveUnsolvedLogsAsync_WithEmptyList_ReturnsEmpty()
     {
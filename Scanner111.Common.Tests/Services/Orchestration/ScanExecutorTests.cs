@@ -85,6 +85,117 @@ public class ScanExecutorTests : IDisposable
         result.ErrorMessages.Should().ContainMatch("*Processing failed*");
     }
     
+    [Fact]
+    public async Task ExecuteScanAsync_WithProcessedLog_ReturnsReportInMemory()
+    {
+        // Arrange
+        var log1 = Path.Combine(_tempDir, "crash-1.log");
+        File.WriteAllText(log1, "log1");
+
+        var config = new ScanConfig { ScanPath = _tempDir, RetainReports = true };
+        var report = ReportFragment.FromLines("# Report", "Body");
+
+        _orchestrator.Setup(x => x.ProcessLogAsync(log1, config, It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new LogAnalysisResult
+            {
+                IsComplete = true,
+                Report = report,
+                Header = new CrashHeader()
+            });
+
+        // Act
+        var result = await _executor.ExecuteScanAsync(config);
+
+        // Assert
+        result.Reports.Should().ContainKey(log1);
+        result.Reports[log1].Lines.Should().Equal("# Report", "Body");
+    }
+
+    [Fact]
+    public async Task ExecuteScanAsync_WithoutRetainReports_DoesNotKeepReports()
+    {
+        // Arrange
+        var log1 = Path.Combine(_tempDir, "crash-1.log");
+        File.WriteAllText(log1, "log1");
+
+        var config = new ScanConfig { ScanPath = _tempDir };
+
+        _orchestrator.Setup(x => x.ProcessLogAsync(log1, config, It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new LogAnalysisResult
+            {
+                IsComplete = true,
+                Report = ReportFragment.FromLines("# Report"),
+                Header = new CrashHeader()
+            });
+
+        // Act
+        var result = await _executor.ExecuteScanAsync(config);
+
+        // Assert
+        result.ProcessedFiles.Should().ContainSingle();
+        result.Reports.Should().BeEmpty();
+    }
+
+    [Fact]
+    public async Task ExecuteScanAsync_WithAutomaticConcurrency_ProcessesAllLogs()
+    {
+        // Arrange
+        for (var i = 0; i < 5; i++)
+        {
+            File.WriteAllText(Path.Combine(_tempDir, $"crash-{i}.log"), "log");
+        }
+
+        var config = new ScanConfig { ScanPath = _tempDir, MaxConcurrent = 0 };
+
+        _orchestrator.Setup(x => x.ProcessLogAsync(It.IsAny<string>(), config, It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new LogAnalysisResult
+            {
+                IsComplete = true,
+                Report = new ReportFragment(),
+                Header = new CrashHeader()
+            });
+
+        // Act
+        var result = await _executor.ExecuteScanAsync(config);
+
+        // Assert
+        result.Statistics.Scanned.Should().Be(5);
+        result.Statistics.Failed.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task ExecuteScanAsync_WithMultipleLogs_CreatesOneOrchestratorPerScan()
+    {
+        // Arrange
+        for (var i = 0; i < 3; i++)
+        {
+            File.WriteAllText(Path.Combine(_tempDir, $"crash-{i}.log"), "log");
+        }
+
+        var config = new ScanConfig { ScanPath = _tempDir, MaxConcurrent = 2 };
+        var factoryCalls = 0;
+        var executor = new ScanExecutor(NullLogger<ScanExecutor>.Instance, () =>
+        {
+            Interlocked.Increment(ref factoryCalls);
+            return _orchestrator.Object;
+        });
+
+        _orchestrator.Setup(x => x.ProcessLogAsync(It.IsAny<string>(), config, It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new LogAnalysisResult
+            {
+                IsComplete = true,
+                Report = new ReportFragment(),
+                Header = new CrashHeader()
+            });
+
+        // Act
+        var result = await executor.ExecuteScanAsync(config);
+
+        // Assert
+        result.Statistics.Scanned.Should().Be(3);
+        factoryCalls.Should().Be(1);
+    }
+
     [Fact]
     public async Task ExecuteScanAsync_WithProgress_ReportsProgress()
     {
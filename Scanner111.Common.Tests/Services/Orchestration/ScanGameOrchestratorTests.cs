@@ -433,9 +433,10 @@ public class ScanGameOrchestratorTests
 
         // Assert
         result.Should().NotBeNull();
-        _fileIO.Verify(x => x.WriteFileAsync(
+        _fileIO.Verify(x => x.WriteLinesAsync(
             reportPath,
-            It.IsAny<string>(),
+            It.IsAny<IEnumerable<string>>(),
+            Environment.NewLine,
             It.IsAny<CancellationToken>()), Times.Once);
     }
 
@@ -457,8 +458,9 @@ public class ScanGameOrchestratorTests
 
         // Assert
         result.Should().NotBeNull();
-        _fileIO.Verify(x => x.WriteFileAsync(
+        _fileIO.Verify(x => x.WriteLinesAsync(
             It.IsAny<string>(),
+            It.IsAny<IEnumerable<string>>(),
             It.IsAny<string>(),
             It.IsAny<CancellationToken>()), Times.Never);
     }
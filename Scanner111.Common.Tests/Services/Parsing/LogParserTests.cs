@@ -177,6 +177,20 @@ Line 3
         segments[0].Lines.Should().Contain(line => line.Contains("Line 3"));
     }
 
+    [Fact]
+    public void ExtractSegments_WithCrLfLineEndings_StripsCarriageReturns()
+    {
+        // Arrange
+        var logContent = "[TestSection]\r\nLine 1\r\nLine 2\r\n";
+
+        // Act
+        var segments = _parser.ExtractSegments(logContent);
+
+        // Assert
+        segments.Should().HaveCount(1);
+        segments[0].Lines.Should().Equal("[TestSection]", "Line 1", "Line 2", string.Empty);
+    }
+
     [Fact]
     public void ExtractSegments_SetsCorrectIndices()
     {
@@ -97,6 +97,20 @@ CPU: Intel Core i7";
         reformatted.Should().Be(logContent);
     }
 
+    [Fact]
+    public void ReformatBuffout4LoadOrder_WithPluginsSection_LeavesEarlierSectionsUnchanged()
+    {
+        // Arrange
+        var logContent = "PROBABLE CALL STACK:\n  12   34    AB NotAPlugin\n\nPLUGINS:\n  0     0      00 Fallout4.esm";
+
+        // Act
+        var reformatted = LogReformatter.ReformatBuffout4LoadOrder(logContent);
+
+        // Assert
+        reformatted.Should().Contain("  12   34    AB NotAPlugin");
+        reformatted.Should().EndWith("  0 0 00 Fallout4.esm");
+    }
+
     [Fact]
     public void ReformatBuffout4LoadOrder_WithMixedContent_OnlyReformatsLoadOrder()
     {
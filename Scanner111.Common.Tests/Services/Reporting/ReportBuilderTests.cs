@@ -203,4 +203,23 @@ public class ReportBuilderTests
         result.Lines.Should().Contain("Section D");
         result.Lines.Should().Contain("D1");
     }
+
+    [Fact]
+    public void Build_WithManyFragments_PreservesAllLinesInOrder()
+    {
+        // Arrange
+        for (var i = 0; i < 500; i++)
+        {
+            _builder.Add(ReportFragment.FromLines($"Line {i}a", $"Line {i}b"));
+        }
+
+        // Act
+        var result = _builder.Build();
+
+        // Assert
+        result.Lines.Should().HaveCount(1000);
+        result.Lines[0].Should().Be("Line 0a");
+        result.Lines[1].Should().Be("Line 0b");
+        result.Lines[^1].Should().Be("Line 499b");
+    }
 }
@@ -420,6 +420,50 @@ public class TomlValidatorTests : IDisposable
         result.Should().BeNull();
     }
 
+    [Fact]
+    public async Task GetValueAsync_WhenFileChanges_ReturnsUpdatedValue()
+    {
+        // Arrange
+        var tomlPath = Path.Combine(_pluginsDirectory, "test.toml");
+        File.WriteAllText(tomlPath, """
+            [Patches]
+            Enabled = true
+            """);
+        var first = await _validator.GetValueAsync<bool>(tomlPath, "Patches", "Enabled");
+
+        File.WriteAllText(tomlPath, """
+            [Patches]
+            Enabled = false
+            """);
+        File.SetLastWriteTimeUtc(tomlPath, DateTime.UtcNow.AddSeconds(5));
+
+        // Act
+        var second = await _validator.GetValueAsync<bool>(tomlPath, "Patches", "Enabled");
+
+        // Assert
+        first.Should().BeTrue();
+        second.Should().BeFalse();
+    }
+
+    [Fact]
+    public async Task GetStringValueAsync_CalledRepeatedly_ReturnsSameValue()
+    {
+        // Arrange
+        var tomlPath = Path.Combine(_pluginsDirectory, "test.toml");
+        File.WriteAllText(tomlPath, """
+            [General]
+            Name = "Buffout4"
+            """);
+
+        // Act
+        var first = await _validator.GetStringValueAsync(tomlPath, "General", "Name");
+        var second = await _validator.GetStringValueAsync(tomlPath, "General", "Name");
+
+        // Assert
+        first.Should().Be("Buffout4");
+        second.Should().Be("Buffout4");
+    }
+
     #endregion
 
     #region TOML Validation Tests
@@ -244,6 +244,32 @@ public class XseCheckerTests : IDisposable
         errors.Should().HaveCount(1);
     }
 
+    [Fact]
+    public async Task ScanLogForErrorsAsync_WithManyPatterns_ReportsFirstConfiguredPatternPerLine()
+    {
+        // Arrange
+        var logPath = CreateFile("f4se.log", """
+            F4SE runtime: 0.6.23, release 0 64-bit
+            INFO: Normal operation
+            plugin couldn't load: fatal error
+            INFO: Still fine
+            """);
+
+        var patterns = new List<string>
+        {
+            "ERROR", "FATAL", "EXCEPTION", "CRASH", "ASSERT",
+            "DISABLED", "CORRUPT", "MISMATCH", "COULDN'T LOAD"
+        };
+
+        // Act
+        var errors = await _checker.ScanLogForErrorsAsync(logPath, patterns);
+
+        // Assert
+        errors.Should().ContainSingle();
+        errors[0].LineNumber.Should().Be(3);
+        errors[0].MatchedPattern.Should().Be("ERROR");
+    }
+
     [Fact]
     public async Task ScanLogForErrorsAsync_WithMissingFile_ReturnsEmpty()
     {
@@ -375,6 +401,29 @@ public class XseCheckerTests : IDisposable
         results.Count(r => r.Status == ScriptHashStatus.Missing).Should().Be(1);
     }
 
+    [Fact]
+    public async Task VerifyScriptHashesAsync_WithManyFiles_PreservesConfiguredOrder()
+    {
+        // Arrange
+        var scriptsFolder = Path.Combine(_tempDirectory, "Scripts");
+        Directory.CreateDirectory(scriptsFolder);
+
+        var expectedHashes = new Dictionary<string, string>();
+        for (var i = 0; i < 20; i++)
+        {
+            var content = $"script {i} content";
+            CreateFile($"Scripts/Script{i}.pex", content);
+            expectedHashes[$"Script{i}.pex"] = ComputeHash(content);
+        }
+
+        // Act
+        var results = await _checker.VerifyScriptHashesAsync(scriptsFolder, expectedHashes);
+
+        // Assert
+        results.Select(r => r.FileName).Should().Equal(expectedHashes.Keys);
+        results.Should().OnlyContain(r => r.Status == ScriptHashStatus.Valid);
+    }
+
     [Fact]
     public async Task VerifyScriptHashesAsync_WithEmptyFolder_ReturnsEmpty()
     {
@@ -159,6 +159,20 @@ public class UserSettingsServiceTests : IDisposable
         first.CustomScanPath.Should().Be(second.CustomScanPath);
     }
 
+    [Fact]
+    public async Task GetCurrentAsync_WithConcurrentFirstCalls_LoadsOnce()
+    {
+        // Arrange
+        await _service.SaveAsync(new UserSettings { CustomScanPath = @"C:\Test" });
+        _service.ClearCache();
+
+        // Act
+        var results = await Task.WhenAll(Enumerable.Range(0, 16).Select(_ => _service.GetCurrentAsync()));
+
+        // Assert
+        results.Should().AllSatisfy(settings => settings.Should().BeSameAs(results[0]));
+    }
+
     #endregion
 
     #region UpdateAsync Tests
@@ -39,7 +39,8 @@ public record ScanConfig
 
     /// <summary>
     /// Gets the maximum number of concurrent log processing tasks.
-    /// Default is 50 to match the original CLASSIC behavior.
+    /// Default is 50 to match the original CLASSIC behavior. A value of zero or less sizes the
+    /// limit from the processor count instead.
     /// </summary>
     public int MaxConcurrent { get; init; } = 50;
 
@@ -48,6 +49,13 @@ public record ScanConfig
     /// </summary>
     public bool FormIdDatabaseExists { get; init; }
 
+    /// <summary>
+    /// Gets a value indicating whether each processed file's report is kept in
+    /// <see cref="ScanResult.Reports"/>. Off by default so batch scans do not hold every
+    /// report in memory; enable it when the caller displays the reports after the scan.
+    /// </summary>
+    public bool RetainReports { get; init; }
+
     /// <summary>
     /// Gets the list of items to remove during log simplification.
     /// </summary>
@@ -1,3 +1,5 @@
+using Scanner111.Common.Models.Reporting;
+
 namespace Scanner111.Common.Models.Configuration;
 
 /// <summary>
@@ -29,4 +31,11 @@ public record ScanResult
     /// Gets the list of error messages encountered during the scan.
     /// </summary>
     public IReadOnlyList<string> ErrorMessages { get; init; } = Array.Empty<string>();
+
+    /// <summary>
+    /// Gets the generated report for each successfully processed file, keyed by log file path.
+    /// Populated only when <see cref="ScanConfig.RetainReports"/> is set; otherwise empty.
+    /// </summary>
+    public IReadOnlyDictionary<string, ReportFragment> Reports { get; init; } =
+        new Dictionary<string, ReportFragment>();
 }
@@ -35,12 +35,10 @@ public record ReportFragment
         if (!HasContent)
             return this;
 
-        return this with
-        {
-            Lines = new[] { header, string.Empty }
-                .Concat(Lines)
-                .ToList()
-        };
+        var lines = new List<string>(Lines.Count + 2) { header, string.Empty };
+        lines.AddRange(Lines);
+
+        return this with { Lines = lines };
     }
 
     /// <summary>
@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Text;
 using System.Text.RegularExpressions;
 using System.Data;
@@ -12,62 +13,102 @@ namespace Scanner111.Common.Services.Analysis;
 /// <summary>
 /// Implementation of <see cref="IFormIdAnalyzer"/> using a database connection.
 /// </summary>
-public class FormIdAnalyzer : IFormIdAnalyzer
+public partial class FormIdAnalyzer : IFormIdAnalyzer
 {
     private readonly ILogger<FormIdAnalyzer> _logger;
     private readonly IDatabaseConnectionFactory _connectionFactory;
-    private static readonly Regex FormIdRegex = new(
-        @"\b(?:0x)?([0-9A-Fa-f]{8})\b",
-        RegexOptions.Compiled
-    );
+    private readonly FormIdLookupCache _lookupCache;
+    private const int FormIdLength = 8;
+    private const int MaxFormIdsPerQuery = 500;
+
+    // Parameter names and query text are the same for every batch of a given size, so they are
+    // built once per process rather than once per batch
+    private static readonly string[] ParameterNames =
+        Enumerable.Range(0, MaxFormIdsPerQuery).Select(i => $"@id{i}").ToArray();
+    private static readonly ConcurrentDictionary<int, string> LookupQueries = new();
+
+    /// <summary>
+    /// Default number of FormID lookup results kept in memory across scans.
+    /// </summary>
+    public const int DefaultMaxCacheSize = 10_000;
+
+    /// <summary>
+    /// Regex to match FormIDs: eight hex digits, optionally prefixed with "0x".
+    /// Source-generated so the matcher is built at compile time rather than on first use, and
+    /// capture-free because callers slice the FormID from the end of the match.
+    /// </summary>
+    [GeneratedRegex(@"\b(?:0x)?[0-9A-Fa-f]{8}\b")]
+    private static partial Regex FormIdRegex();
 
     /// <summary>
     /// Initializes a new instance of the <see cref="FormIdAnalyzer"/> class.
     /// </summary>
     /// <param name="logger">The logger instance.</param>
     /// <param name="connectionFactory">The database connection factory.</param>
-    public FormIdAnalyzer(ILogger<FormIdAnalyzer> logger, IDatabaseConnectionFactory connectionFactory)
+    /// <param name="maxCacheSize">The maximum number of FormID lookup results to cache.</param>
+    public FormIdAnalyzer(
+        ILogger<FormIdAnalyzer> logger,
+        IDatabaseConnectionFactory connectionFactory,
+        int maxCacheSize = DefaultMaxCacheSize)
     {
         _logger = logger ?? throw new ArgumentNullException(nameof(logger));
         _connectionFactory = connectionFactory ?? throw new ArgumentNullException(nameof(connectionFactory));
+        _lookupCache = new FormIdLookupCache(maxCacheSize);
     }
 
     /// <inheritdoc/>
     public async Task<FormIdAnalysisResult> AnalyzeAsync(
         IReadOnlyList<LogSegment> segments,
         CancellationToken ct = default)
+    {
+        var foundFormIds = ExtractFormIds(segments);
+
+        if (foundFormIds.Count == 0)
+        {
+            return new FormIdAnalysisResult();
+        }
+
+        var lookups = await LookupFormIdsAsync(foundFormIds.ToList(), ct).ConfigureAwait(false);
+
+        return new FormIdAnalysisResult
+        {
+            DetectedRecords = lookups
+        };
+    }
+
+    /// <summary>
+    /// Collects the distinct, upper-cased FormIDs referenced in the given segments.
+    /// </summary>
+    private static HashSet<string> ExtractFormIds(IReadOnlyList<LogSegment> segments)
     {
         var foundFormIds = new HashSet<string>();
+        Span<char> upper = stackalloc char[FormIdLength];
+        var formIdRegex = FormIdRegex();
 
         foreach (var segment in segments)
         {
             // Skip segments that shouldn't be scanned for FormIDs to save time/noise
             if (segment.Name.Contains("Modules", StringComparison.OrdinalIgnoreCase)) continue;
-            
+            if (segment.Lines.Count == 0) continue;
+
+            // Scan the lines in place rather than joining them into one transient copy of the
+            // segment. EnumerateMatches avoids allocating Match objects.
             foreach (var line in segment.Lines)
             {
-                var matches = FormIdRegex.Matches(line);
-                foreach (Match match in matches)
+                // Lines too short to hold a FormID never reach the regex engine
+                if (line.Length < FormIdLength) continue;
+
+                foreach (var match in formIdRegex.EnumerateMatches(line))
                 {
-                    if (match.Success)
-                    {
-                        foundFormIds.Add(match.Groups[1].Value.ToUpperInvariant());
-                    }
+                    // The FormID is always the last eight characters of the match (after any "0x").
+                    var formId = line.AsSpan(match.Index + match.Length - FormIdLength, FormIdLength);
+                    formId.ToUpperInvariant(upper);
+                    foundFormIds.Add(new string(upper));
                 }
             }
         }
 
-        if (foundFormIds.Count == 0)
-        {
-            return new FormIdAnalysisResult();
-        }
-
-        var lookups = await LookupFormIdsAsync(foundFormIds.ToList(), ct).ConfigureAwait(false);
-
-        return new FormIdAnalysisResult
-        {
-            DetectedRecords = lookups
-        };
+        return foundFormIds;
     }
 
     /// <inheritdoc/>
@@ -80,74 +121,129 @@ public class FormIdAnalyzer : IFormIdAnalyzer
             return new Dictionary<string, string>();
         }
 
-        try
-        {
-            using var connection = await _connectionFactory.CreateConnectionAsync(ct).ConfigureAwait(false);
+        var results = new Dictionary<string, string>();
 
-            // Construct parameterized query manually since we aren't using Dapper
-            using var command = connection.CreateCommand();
-            var parameters = new List<string>();
-            var sb = new StringBuilder();
-            sb.Append("SELECT FormID, RecordName FROM FormIDDatabase WHERE FormID IN (");
-
-            for (int i = 0; i < formIds.Count; i++)
+        // Serve previously seen FormIDs (found or not) from the cache; only the rest hit the
+        // database. The FormID column compares with BINARY collation and stores upper-case hex,
+        // so IDs are upper-cased once up front: IDs differing only by case then collapse into a
+        // single parameter, and the value bound is the one the database can match.
+        var uniqueIds = new List<string>();
+        foreach (var formId in formIds.Select(id => id.ToUpperInvariant()).Distinct(StringComparer.Ordinal))
+        {
+            if (!_lookupCache.TryGet(formId, out var cachedName))
             {
-                var paramName = $"@id{i}";
-                parameters.Add(paramName);
-
-                var parameter = command.CreateParameter();
-                parameter.ParameterName = paramName;
-                parameter.Value = formIds[i];
-                command.Parameters.Add(parameter);
+                uniqueIds.Add(formId);
+            }
+            else if (cachedName != null)
+            {
+                results.TryAdd(formId, cachedName);
             }
+        }
 
-            sb.Append(string.Join(",", parameters));
-            sb.Append(")");
-            command.CommandText = sb.ToString();
+        if (uniqueIds.Count == 0)
+        {
+            return results;
+        }
 
-            if (command is DbCommand dbCommand)
+        try
+        {
+            using var connection = await _connectionFactory.CreateConnectionAsync(ct).ConfigureAwait(false);
+            var queried = new Dictionary<string, string>();
+
+            // Query in bounded batches so very large FormID sets stay under SQLite's
+            // host-parameter limit while still resolving hundreds of IDs per round trip.
+            for (var offset = 0; offset < uniqueIds.Count; offset += MaxFormIdsPerQuery)
             {
-                using var reader = await dbCommand.ExecuteReaderAsync(ct).ConfigureAwait(false);
-                var results = new Dictionary<string, string>();
+                var batchSize = Math.Min(MaxFormIdsPerQuery, uniqueIds.Count - offset);
+
+                // Construct parameterized query manually since we aren't using Dapper
+                using var command = connection.CreateCommand();
+                command.CommandText = GetLookupQuery(batchSize);
 
-                while (await reader.ReadAsync(ct).ConfigureAwait(false))
+                for (int i = 0; i < batchSize; i++)
                 {
-                    var formId = reader.GetString(0).ToUpperInvariant();
-                    var recordName = reader.GetString(1);
-                    if (!results.ContainsKey(formId))
-                    {
-                        results[formId] = recordName;
-                    }
+                    var parameter = command.CreateParameter();
+                    parameter.ParameterName = ParameterNames[i];
+                    parameter.Value = uniqueIds[offset + i];
+                    command.Parameters.Add(parameter);
                 }
-                return results;
+
+                await ReadLookupResultsAsync(command, queried, ct).ConfigureAwait(false);
             }
-            else
+
+            foreach (var formId in uniqueIds)
             {
-                // Fallback for non-DbCommand (unlikely in typical ADO.NET but safe)
-                using var reader = command.ExecuteReader();
-                var results = new Dictionary<string, string>();
+                queried.TryGetValue(formId, out var recordName);
+                _lookupCache.Set(formId, recordName);
+            }
 
-                while (reader.Read())
-                {
-                    var formId = reader.GetString(0).ToUpperInvariant();
-                    var recordName = reader.GetString(1);
-                    if (!results.ContainsKey(formId))
-                    {
-                        results[formId] = recordName;
-                    }
-                }
-                return results;
+            foreach (var (formId, recordName) in queried)
+            {
+                results.TryAdd(formId, recordName);
             }
+
+            return results;
         }
         catch (SqliteException ex)
         {
             _logger.LogError(ex, "SQLite error while looking up FormIDs");
-            return new Dictionary<string, string>();
+            return results;
         }
         catch (InvalidOperationException ex)
         {
             _logger.LogError(ex, "Database connection error during FormID lookup");
-            return new Dictionary<string, string>();
+            return results;
+        }
+    }
+
+    /// <summary>
+    /// Gets the lookup query for a batch of <paramref name="batchSize"/> FormIDs, building it only
+    /// the first time that batch size is seen.
+    /// </summary>
+    private static string GetLookupQuery(int batchSize)
+    {
+        return LookupQueries.GetOrAdd(batchSize, static size =>
+        {
+            var sb = new StringBuilder("SELECT FormID, RecordName FROM FormIDDatabase WHERE FormID IN (");
+            sb.AppendJoin(',', ParameterNames.Take(size));
+            sb.Append(')');
+            return sb.ToString();
+        });
+    }
+
+    /// <summary>
+    /// Executes a lookup command and adds each (FormID, RecordName) row to <paramref name="results"/>,
+    /// keeping the first record name seen for a FormID.
+    /// </summary>
+    private static async Task ReadLookupResultsAsync(
+        IDbCommand command,
+        Dictionary<string, string> results,
+        CancellationToken ct)
+    {
+        if (command is DbCommand dbCommand)
+        {
+            // Only opening the reader is awaited. SQLite steps rows synchronously, so awaiting
+            // ReadAsync per row would add overhead without ever yielding.
+            using var reader = await dbCommand.ExecuteReaderAsync(ct).ConfigureAwait(false);
+            CopyLookupRows(reader, results);
+        }
+        else
+        {
+            // Fallback for non-DbCommand (unlikely in typical ADO.NET but safe)
+            using var reader = command.ExecuteReader();
+            CopyLookupRows(reader, results);
+        }
+    }
+
+    /// <summary>
+    /// Copies (FormID, RecordName) rows into <paramref name="results"/>, keeping the first record
+    /// name seen for each FormID.
+    /// </summary>
+    private static void CopyLookupRows(IDataReader reader, Dictionary<string, string> results)
+    {
+        while (reader.Read())
+        {
+            results.TryAdd(reader.GetString(0).ToUpperInvariant(), reader.GetString(1));
         }
     }
-}
\ No newline at end of file
+}
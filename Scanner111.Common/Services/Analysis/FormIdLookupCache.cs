@@ -0,0 +1,81 @@
+namespace Scanner111.Common.Services.Analysis;
+
+/// <summary>
+/// Bounded, thread-safe least-recently-used cache of FormID lookup results.
+/// </summary>
+/// <remarks>
+/// Negative results are cached as <c>null</c> so FormIDs that are not in the database are not
+/// queried again on every scan. When the cache is full, the least recently used entry is evicted,
+/// which keeps memory bounded for long-running sessions. Callers normalize FormIDs to upper case
+/// before use, so keys are compared ordinally.
+/// </remarks>
+internal sealed class FormIdLookupCache
+{
+    private readonly int _capacity;
+    private readonly Dictionary<string, LinkedListNode<(string FormId, string? RecordName)>> _entries;
+    private readonly LinkedList<(string FormId, string? RecordName)> _recency = new();
+    private readonly object _lock = new();
+
+    /// <summary>
+    /// Initializes a new instance of the <see cref="FormIdLookupCache"/> class.
+    /// </summary>
+    /// <param name="capacity">The maximum number of FormIDs to keep.</param>
+    public FormIdLookupCache(int capacity)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(capacity);
+
+        _capacity = capacity;
+        _entries = new Dictionary<string, LinkedListNode<(string, string?)>>(StringComparer.Ordinal);
+    }
+
+    /// <summary>
+    /// Tries to get a cached lookup result, marking it as most recently used.
+    /// </summary>
+    /// <param name="formId">The FormID that was looked up.</param>
+    /// <param name="recordName">The cached record name, or <c>null</c> for a cached miss.</param>
+    /// <returns><c>true</c> if the FormID has a cached result; otherwise <c>false</c>.</returns>
+    public bool TryGet(string formId, out string? recordName)
+    {
+        lock (_lock)
+        {
+            if (_entries.TryGetValue(formId, out var node))
+            {
+                _recency.Remove(node);
+                _recency.AddFirst(node);
+                recordName = node.Value.RecordName;
+                return true;
+            }
+        }
+
+        recordName = null;
+        return false;
+    }
+
+    /// <summary>
+    /// Stores a lookup result, evicting the least recently used entry if the cache is full.
+    /// </summary>
+    /// <param name="formId">The FormID that was looked up.</param>
+    /// <param name="recordName">The record name found, or <c>null</c> if the FormID was not found.</param>
+    public void Set(string formId, string? recordName)
+    {
+        lock (_lock)
+        {
+            if (_entries.TryGetValue(formId, out var existing))
+            {
+                _recency.Remove(existing);
+                existing.Value = (formId, recordName);
+                _recency.AddFirst(existing);
+                return;
+            }
+
+            if (_entries.Count >= _capacity)
+            {
+                var oldest = _recency.Last!;
+                _recency.RemoveLast();
+                _entries.Remove(oldest.Value.FormId);
+            }
+
+            _entries[formId] = _recency.AddFirst((formId, recordName));
+        }
+    }
+}
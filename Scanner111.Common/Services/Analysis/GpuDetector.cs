@@ -1,3 +1,4 @@
+using System.Buffers;
 using Scanner111.Common.Models.Analysis;
 
 namespace Scanner111.Common.Services.Analysis;
@@ -8,8 +9,13 @@ namespace Scanner111.Common.Services.Analysis;
 public class GpuDetector : IGpuDetector
 {
     private const string SystemSpecsSegmentName = "SYSTEM SPECS";
-    private const string GpuPrimaryPrefix = "GPU #1";
-    private const string GpuSecondaryPrefix = "GPU #2";
+    private const string GpuPrefix = "GPU #";
+
+    private static readonly SearchValues<string> AmdKeywords =
+        SearchValues.Create(["AMD", "Radeon"], StringComparison.OrdinalIgnoreCase);
+
+    private static readonly SearchValues<string> NvidiaKeywords =
+        SearchValues.Create(["Nvidia", "GeForce", "GTX", "RTX"], StringComparison.OrdinalIgnoreCase);
 
     /// <inheritdoc/>
     public GpuInfo Detect(LogSegment? systemSpecsSegment)
@@ -19,48 +25,51 @@ public class GpuDetector : IGpuDetector
             return GpuInfo.Unknown;
         }
 
+        return ParseGpuInfo(systemSpecsSegment.Lines);
+    }
+
+    /// <summary>
+    /// Extracts GPU names and the manufacturer from system specs lines.
+    /// </summary>
+    private static GpuInfo ParseGpuInfo(IReadOnlyList<string> lines)
+    {
         string? primaryGpu = null;
         string? secondaryGpu = null;
         GpuType? manufacturer = null;
         GpuType? rival = null;
 
-        foreach (var line in systemSpecsSegment.Lines)
+        foreach (var line in lines)
         {
-            var trimmedLine = line.Trim();
+            // One search per line for the shared "GPU #" prefix; the slot digit that follows
+            // decides which GPU the line describes
+            var prefixIndex = line.IndexOf(GpuPrefix, StringComparison.OrdinalIgnoreCase);
+            if (prefixIndex < 0 || prefixIndex + GpuPrefix.Length >= line.Length)
+            {
+                continue;
+            }
 
-            if (trimmedLine.Contains(GpuPrimaryPrefix, StringComparison.OrdinalIgnoreCase))
+            var slot = line[prefixIndex + GpuPrefix.Length];
+            if (slot == '1')
             {
                 // Extract full GPU name after the colon
-                var colonIndex = trimmedLine.IndexOf(':');
-                if (colonIndex >= 0 && colonIndex < trimmedLine.Length - 1)
-                {
-                    primaryGpu = trimmedLine[(colonIndex + 1)..].Trim();
-                }
+                primaryGpu = ExtractGpuName(line) ?? primaryGpu;
 
                 // Determine manufacturer from the line
-                if (trimmedLine.Contains("AMD", StringComparison.OrdinalIgnoreCase) ||
-                    trimmedLine.Contains("Radeon", StringComparison.OrdinalIgnoreCase))
+                if (line.AsSpan().ContainsAny(AmdKeywords))
                 {
                     manufacturer = GpuType.Amd;
                     rival = GpuType.Nvidia;
                 }
-                else if (trimmedLine.Contains("Nvidia", StringComparison.OrdinalIgnoreCase) ||
-                         trimmedLine.Contains("GeForce", StringComparison.OrdinalIgnoreCase) ||
-                         trimmedLine.Contains("GTX", StringComparison.OrdinalIgnoreCase) ||
-                         trimmedLine.Contains("RTX", StringComparison.OrdinalIgnoreCase))
+                else if (line.AsSpan().ContainsAny(NvidiaKeywords))
                 {
                     manufacturer = GpuType.Nvidia;
                     rival = GpuType.Amd;
                 }
             }
-            else if (trimmedLine.Contains(GpuSecondaryPrefix, StringComparison.OrdinalIgnoreCase))
+            else if (slot == '2')
             {
                 // Extract secondary GPU name after the colon
-                var colonIndex = trimmedLine.IndexOf(':');
-                if (colonIndex >= 0 && colonIndex < trimmedLine.Length - 1)
-                {
-                    secondaryGpu = trimmedLine[(colonIndex + 1)..].Trim();
-                }
+                secondaryGpu = ExtractGpuName(line) ?? secondaryGpu;
             }
         }
 
@@ -73,6 +82,21 @@ public class GpuDetector : IGpuDetector
         };
     }
 
+    /// <summary>
+    /// Returns the trimmed text after the first colon of a GPU line, or null when there is none.
+    /// </summary>
+    private static string? ExtractGpuName(string line)
+    {
+        var trimmed = line.AsSpan().Trim();
+        var colonIndex = trimmed.IndexOf(':');
+        if (colonIndex < 0 || colonIndex >= trimmed.Length - 1)
+        {
+            return null;
+        }
+
+        return trimmed[(colonIndex + 1)..].Trim().ToString();
+    }
+
     /// <inheritdoc/>
     public GpuInfo DetectFromSegments(IReadOnlyList<LogSegment> segments)
     {
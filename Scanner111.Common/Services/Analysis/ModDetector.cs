@@ -1,4 +1,6 @@
+using System.Buffers;
 using System.Collections.Concurrent;
+using System.Runtime.CompilerServices;
 using System.Text.RegularExpressions;
 using Scanner111.Common.Models.Analysis;
 using Scanner111.Common.Models.Configuration;
@@ -11,7 +13,9 @@ namespace Scanner111.Common.Services.Analysis;
 /// </summary>
 public class ModDetector : IModDetector
 {
-    private readonly ConcurrentDictionary<string, Regex> _patternCache = new();
+    private readonly ConcurrentDictionary<string, Regex> _patternCache = new(StringComparer.OrdinalIgnoreCase);
+    private readonly ConditionalWeakTable<Dictionary<string, string>, MappingSnapshot<SearchValues<string>>> _mappingSearchCache = new();
+    private readonly ConditionalWeakTable<Dictionary<string, string>, MappingSnapshot<Dictionary<(string Mod1, string Mod2), string>>> _conflictPairCache = new();
 
     /// <summary>
     /// Gets or sets the mod configuration used for detection.
@@ -41,8 +45,9 @@ public class ModDetector : IModDetector
         // Detect mod conflicts
         var conflicts = DetectConflicts(Configuration.ConflictingMods, pluginLookup);
 
-        // Check important mods
-        var allPluginText = string.Join(" ", pluginLookup.Keys.Concat(xseModules.Select(m => m.ToLowerInvariant())));
+        // Check important mods; the patterns match case-insensitively, so module names are
+        // joined as-is rather than lowered one allocation at a time
+        var allPluginText = string.Join(" ", pluginLookup.Keys.Concat(xseModules));
         var importantMods = CheckImportantMods(Configuration.ImportantMods, allPluginText, gpuType);
 
         return new ModDetectionResult
@@ -129,7 +134,7 @@ public class ModDetector : IModDetector
             }
         }
 
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     private List<DetectedMod> DetectSingleMods(
@@ -146,11 +151,19 @@ public class ModDetector : IModDetector
 
         var matchedPlugins = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
 
+        // Only plugins containing at least one mod pattern can match, so screen them once with a
+        // multi-pattern search instead of testing every pattern against every plugin
+        var candidatePlugins = GetCandidatePlugins(modMappings, pluginLookup);
+        if (candidatePlugins.Count == 0)
+        {
+            return detectedMods;
+        }
+
         foreach (var (modPattern, warning) in sortedMappings)
         {
             var pattern = GetOrCompilePattern(modPattern);
 
-            foreach (var (pluginName, formId) in pluginLookup)
+            foreach (var (pluginName, formId) in candidatePlugins)
             {
                 if (matchedPlugins.Contains(pluginName))
                     continue;
@@ -181,49 +194,54 @@ public class ModDetector : IModDetector
         return detectedMods;
     }
 
-    private List<ModConflict> DetectConflicts(
-        Dictionary<string, string> conflictMappings,
+    /// <summary>
+    /// Gets the plugins, in lookup order, whose names contain at least one pattern of
+    /// <paramref name="modMappings"/>.
+    /// </summary>
+    private IReadOnlyCollection<KeyValuePair<string, string>> GetCandidatePlugins(
+        Dictionary<string, string> modMappings,
         Dictionary<string, string> pluginLookup)
     {
-        var conflicts = new List<ModConflict>();
-
-        // Build set of all unique mod names from conflict pairs
-        var allModPatterns = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
-        var pairMappings = new Dictionary<(string, string), string>();
+        if (modMappings.Count == 0)
+        {
+            return Array.Empty<KeyValuePair<string, string>>();
+        }
 
-        foreach (var (modPair, warning) in conflictMappings)
+        // An empty pattern matches every plugin, so nothing can be screened out
+        if (modMappings.Keys.Any(string.IsNullOrEmpty))
         {
-            var parts = modPair.Split(" | ", 2, StringSplitOptions.TrimEntries);
-            if (parts.Length != 2) continue;
+            return pluginLookup;
+        }
 
-            var mod1 = parts[0].ToLowerInvariant();
-            var mod2 = parts[1].ToLowerInvariant();
+        var modSearch = GetOrBuild<SearchValues<string>>(_mappingSearchCache, modMappings, static mappings =>
+            SearchValues.Create(mappings.Keys.ToArray(), StringComparison.OrdinalIgnoreCase));
 
-            allModPatterns.Add(mod1);
-            allModPatterns.Add(mod2);
-            pairMappings[(mod1, mod2)] = warning;
-        }
+        return pluginLookup
+            .Where(plugin => plugin.Key.AsSpan().ContainsAny(modSearch))
+            .ToList();
+    }
 
-        if (allModPatterns.Count == 0)
-            return conflicts;
+    private List<ModConflict> DetectConflicts(
+        Dictionary<string, string> conflictMappings,
+        Dictionary<string, string> pluginLookup)
+    {
+        var conflicts = new List<ModConflict>();
 
-        // Find which mods are present
-        var modsPresent = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
-        var combinedPattern = BuildCombinedPattern(allModPatterns);
+        // The parsed pairs depend only on the configuration, so they are built once per conflict
+        // mapping rather than on every log
+        var conflictPairs = GetOrBuild(_conflictPairCache, conflictMappings, BuildConflictPairs);
+        if (conflictPairs.Count == 0)
+            return conflicts;
 
-        foreach (var pluginName in pluginLookup.Keys)
-        {
-            var matches = combinedPattern.Matches(pluginName);
-            foreach (Match match in matches)
-            {
-                modsPresent.Add(match.Value.ToLowerInvariant());
-            }
-        }
+        // Search one NUL-separated haystack of all plugin names per mod instead of matching every
+        // plugin individually; mod names never contain NUL, so matches cannot span two plugins
+        var pluginHaystack = string.Join('\0', pluginLookup.Keys);
 
         // Check for conflicting pairs
-        foreach (var ((mod1, mod2), warning) in pairMappings)
+        foreach (var ((mod1, mod2), warning) in conflictPairs)
         {
-            if (modsPresent.Contains(mod1) && modsPresent.Contains(mod2))
+            if (pluginHaystack.Contains(mod1, StringComparison.OrdinalIgnoreCase) &&
+                pluginHaystack.Contains(mod2, StringComparison.OrdinalIgnoreCase))
             {
                 conflicts.Add(new ModConflict
                 {
@@ -237,12 +255,53 @@ public class ModDetector : IModDetector
         return conflicts;
     }
 
+    /// <summary>
+    /// Gets the value built from <paramref name="mappings"/>, rebuilding it when the dictionary's
+    /// entries no longer match the snapshot the cached value was built from.
+    /// </summary>
+    /// <remarks>
+    /// The mapping dictionaries are mutable, so the cache cannot rely on reference identity alone.
+    /// Comparing against the snapshot is a hash lookup per entry, far cheaper than the rebuild.
+    /// </remarks>
+    private static T GetOrBuild<T>(
+        ConditionalWeakTable<Dictionary<string, string>, MappingSnapshot<T>> cache,
+        Dictionary<string, string> mappings,
+        Func<Dictionary<string, string>, T> build)
+    {
+        if (cache.TryGetValue(mappings, out var cached) && cached.Matches(mappings))
+        {
+            return cached.Value;
+        }
+
+        var snapshot = new MappingSnapshot<T>(mappings.ToArray(), build(mappings));
+        cache.AddOrUpdate(mappings, snapshot);
+        return snapshot.Value;
+    }
+
+    private static Dictionary<(string Mod1, string Mod2), string> BuildConflictPairs(
+        Dictionary<string, string> conflictMappings)
+    {
+        var pairMappings = new Dictionary<(string, string), string>();
+
+        foreach (var (modPair, warning) in conflictMappings)
+        {
+            var parts = modPair.Split(" | ", 2, StringSplitOptions.TrimEntries);
+            if (parts.Length != 2) continue;
+
+            pairMappings[(parts[0].ToLowerInvariant(), parts[1].ToLowerInvariant())] = warning;
+        }
+
+        return pairMappings;
+    }
+
     private List<ImportantModStatus> CheckImportantMods(
         Dictionary<string, string> importantMods,
         string allPluginText,
         GpuType? gpuType)
     {
         var results = new List<ImportantModStatus>();
+        var gpuTypeString = gpuType?.ToString();
+        var rivalGpu = gpuType == GpuType.Nvidia ? "amd" : "nvidia";
 
         foreach (var (modEntry, warning) in importantMods)
         {
@@ -256,14 +315,12 @@ public class ModDetector : IModDetector
             var isInstalled = pattern.IsMatch(allPluginText);
 
             // Check GPU compatibility
-            var gpuTypeString = gpuType?.ToString().ToLowerInvariant();
             var hasGpuConcern = false;
 
             if (isInstalled && gpuType.HasValue && !string.IsNullOrEmpty(warning))
             {
                 // If the warning mentions a GPU type and user has that GPU type's rival
-                var warningLower = warning.ToLowerInvariant();
-                hasGpuConcern = warningLower.Contains(gpuTypeString ?? string.Empty);
+                hasGpuConcern = warning.Contains(gpuTypeString ?? string.Empty, StringComparison.OrdinalIgnoreCase);
             }
 
             // Determine if we should show a warning
@@ -273,10 +330,8 @@ public class ModDetector : IModDetector
                 // Only show warning for not installed if warning doesn't mention rival GPU
                 if (gpuType.HasValue)
                 {
-                    var rivalGpu = gpuType == GpuType.Nvidia ? "amd" : "nvidia";
-                    var warningLower = warning.ToLowerInvariant();
                     // Only show if the mod isn't specific to the rival GPU
-                    if (!warningLower.Contains(rivalGpu))
+                    if (!warning.Contains(rivalGpu, StringComparison.OrdinalIgnoreCase))
                     {
                         warningMessage = warning;
                     }
@@ -301,19 +356,34 @@ public class ModDetector : IModDetector
 
     private Regex GetOrCompilePattern(string pattern)
     {
-        return _patternCache.GetOrAdd(pattern.ToLowerInvariant(), p =>
-            new Regex(Regex.Escape(p), RegexOptions.Compiled | RegexOptions.IgnoreCase));
+        // The cache is keyed case-insensitively, so patterns are not lowered on every lookup
+        return _patternCache.GetOrAdd(pattern, p =>
+            new Regex(Regex.Escape(p.ToLowerInvariant()), RegexOptions.Compiled | RegexOptions.IgnoreCase));
     }
 
-    private Regex BuildCombinedPattern(IEnumerable<string> patterns)
+    /// <summary>
+    /// A value built from a mapping dictionary, together with a copy of the entries it was built from.
+    /// </summary>
+    private sealed class MappingSnapshot<T>(KeyValuePair<string, string>[] entries, T value)
     {
-        // Sort by length descending for most specific matches first
-        var sortedPatterns = patterns
-            .OrderByDescending(p => p.Length)
-            .Select(p => Regex.Escape(p))
-            .ToList();
+        public T Value { get; } = value;
+
+        public bool Matches(Dictionary<string, string> mappings)
+        {
+            if (mappings.Count != entries.Length)
+            {
+                return false;
+            }
+
+            foreach (var (key, expected) in entries)
+            {
+                if (!mappings.TryGetValue(key, out var actual) || !string.Equals(actual, expected, StringComparison.Ordinal))
+                {
+                    return false;
+                }
+            }
 
-        var combinedPattern = string.Join("|", sortedPatterns);
-        return new Regex(combinedPattern, RegexOptions.Compiled | RegexOptions.IgnoreCase);
+            return true;
+        }
     }
 }
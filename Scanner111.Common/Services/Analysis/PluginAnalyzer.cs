@@ -72,16 +72,32 @@ public class PluginAnalyzer : IPluginAnalyzer
         IReadOnlyList<string> patterns)
     {
         var matches = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
+        if (patterns.Count == 0)
+        {
+            return Array.Empty<string>();
+        }
 
-        foreach (var pattern in patterns)
+        var regexes = new Regex[patterns.Count];
+        for (var i = 0; i < regexes.Length; i++)
         {
-            var regex = GetOrCompileRegex(pattern);
+            regexes[i] = GetOrCompileRegex(patterns[i]);
+        }
+
+        // Test each plugin until its first matching pattern; once a plugin has matched, the
+        // remaining patterns cannot change the result
+        foreach (var pluginName in pluginNames)
+        {
+            if (matches.Contains(pluginName))
+            {
+                continue;
+            }
 
-            foreach (var pluginName in pluginNames)
+            foreach (var regex in regexes)
             {
                 if (regex.IsMatch(pluginName))
                 {
                     matches.Add(pluginName);
+                    break;
                 }
             }
         }
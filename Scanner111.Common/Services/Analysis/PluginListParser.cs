@@ -35,6 +35,13 @@ public partial class PluginListParser
 
         foreach (var line in pluginSegment.Lines)
         {
+            // Every plugin line carries a bracketed prefix; a vectorized character search rejects
+            // the header, blank and other lines without running the regex on them.
+            if (!line.Contains('['))
+            {
+                continue;
+            }
+
             var match = PluginLineRegex().Match(line);
             if (match.Success)
             {
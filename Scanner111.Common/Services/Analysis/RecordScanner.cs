@@ -1,5 +1,5 @@
-using System.Collections.Concurrent;
-using System.Text.RegularExpressions;
+using System.Buffers;
+using System.Runtime.InteropServices;
 using Scanner111.Common.Models.Analysis;
 using Scanner111.Common.Models.Reporting;
 
@@ -14,10 +14,8 @@ public class RecordScanner : IRecordScanner
     private const int RspOffset = 30;
     private const string StackSegmentName = "STACK";
 
-    private readonly ConcurrentDictionary<string, Regex> _patternCache = new();
-
-    private Regex? _targetPattern;
-    private Regex? _ignorePattern;
+    private SearchValues<string>? _targetPattern;
+    private SearchValues<string>? _ignorePattern;
     private RecordScannerConfiguration _configuration = RecordScannerConfiguration.Empty;
 
     /// <inheritdoc/>
@@ -50,19 +48,20 @@ public class RecordScanner : IRecordScanner
         }
 
         var matchedRecords = new List<string>();
+        var counts = new Dictionary<string, int>(StringComparer.OrdinalIgnoreCase);
 
         foreach (var line in callStackSegment.Lines)
         {
             cancellationToken.ThrowIfCancellationRequested();
 
             // Check if line contains any target record
-            if (!_targetPattern.IsMatch(line))
+            if (!line.AsSpan().ContainsAny(_targetPattern))
             {
                 continue;
             }
 
             // Check if line should be ignored
-            if (_ignorePattern != null && _ignorePattern.IsMatch(line))
+            if (_ignorePattern != null && line.AsSpan().ContainsAny(_ignorePattern))
             {
                 continue;
             }
@@ -72,14 +71,14 @@ public class RecordScanner : IRecordScanner
             if (!string.IsNullOrWhiteSpace(recordText))
             {
                 matchedRecords.Add(recordText);
+                CollectionsMarshal.GetValueRefOrAddDefault(counts, recordText, out _)++;
             }
         }
 
-        // Build record counts
-        var recordCounts = matchedRecords
-            .GroupBy(r => r, StringComparer.OrdinalIgnoreCase)
-            .OrderBy(g => g.Key)
-            .ToDictionary(g => g.Key, g => g.Count());
+        // Counts were tallied during the scan; only the unique records need ordering for the report
+        var recordCounts = counts
+            .OrderBy(kv => kv.Key)
+            .ToDictionary(kv => kv.Key, kv => kv.Value);
 
         return new RecordScanResult
         {
@@ -109,7 +108,7 @@ public class RecordScanner : IRecordScanner
         {
             lines.Add("* COULDN'T FIND ANY NAMED RECORDS *");
             lines.Add(string.Empty);
-            return ReportFragment.FromLines(lines.ToArray());
+            return new ReportFragment { Lines = lines };
         }
 
         lines.Add("## Named Records Found");
@@ -129,7 +128,7 @@ public class RecordScanner : IRecordScanner
         lines.Add("> Named records give extra info on involved game objects, record types, or mod files.");
         lines.Add(string.Empty);
 
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     private void RebuildPatterns()
@@ -138,27 +137,25 @@ public class RecordScanner : IRecordScanner
         _ignorePattern = BuildCombinedPattern(_configuration.IgnoreRecords);
     }
 
-    private Regex? BuildCombinedPattern(IReadOnlyList<string> patterns)
+    private static SearchValues<string>? BuildCombinedPattern(IReadOnlyList<string> patterns)
     {
         if (patterns.Count == 0)
         {
             return null;
         }
 
-        // Sort by length descending for most specific matches first
-        var sortedPatterns = patterns
+        // The records are plain substrings, so one case-insensitive multi-string search finds any
+        // of them in a single pass over the line without going through a regex alternation
+        var records = patterns
             .Where(p => !string.IsNullOrWhiteSpace(p))
-            .Select(p => Regex.Escape(p.ToLowerInvariant()))
-            .OrderByDescending(p => p.Length)
-            .ToList();
+            .ToArray();
 
-        if (sortedPatterns.Count == 0)
+        if (records.Length == 0)
         {
             return null;
         }
 
-        var combinedPattern = string.Join("|", sortedPatterns);
-        return new Regex(combinedPattern, RegexOptions.Compiled | RegexOptions.IgnoreCase);
+        return SearchValues.Create(records, StringComparison.OrdinalIgnoreCase);
     }
 
     private static string ExtractRecordText(string line)
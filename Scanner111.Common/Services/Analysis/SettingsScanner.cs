@@ -8,13 +8,6 @@ namespace Scanner111.Common.Services.Analysis;
 /// </summary>
 public partial class SettingsScanner : ISettingsScanner
 {
-    /// <summary>
-    /// Regex to match setting lines in the format: SettingName: value
-    /// Example: "MemoryManager: false"
-    /// </summary>
-    [GeneratedRegex(@"^\s*([A-Za-z0-9_]+)\s*:\s*(.+?)\s*$", RegexOptions.Multiline)]
-    private static partial Regex SettingLineRegex();
-
     /// <summary>
     /// Regex to match version information.
     /// Example: "Buffout 4 v1.26.2" or "Crash Logger v1.0.0"
@@ -22,6 +15,19 @@ public partial class SettingsScanner : ISettingsScanner
     [GeneratedRegex(@"(Buffout\s+4|Crash Logger|Trainwreck)\s+v([\d.]+)", RegexOptions.IgnoreCase)]
     private static partial Regex VersionRegex();
 
+    /// <summary>
+    /// Regex to extract the version number from a detected version string.
+    /// Example: "Buffout 4 v1.26.2" yields "1.26.2"
+    /// </summary>
+    [GeneratedRegex(@"v([\d.]+)")]
+    private static partial Regex DetectedVersionNumberRegex();
+
+    /// <summary>
+    /// Regex to extract the version number from a configured latest version string.
+    /// </summary>
+    [GeneratedRegex(@"[\d.]+")]
+    private static partial Regex VersionNumberRegex();
+
     /// <inheritdoc/>
     public async Task<SettingsScanResult> ScanAsync(
         LogSegment? compatibilitySegment,
@@ -42,7 +48,7 @@ public partial class SettingsScanner : ISettingsScanner
 
         var content = string.Join("\n", compatibilitySegment.Lines);
 
-        var detectedSettings = ExtractSettings(content);
+        var detectedSettings = ExtractSettings(compatibilitySegment.Lines);
         var detectedVersion = ExtractVersion(content);
         var misconfigurations = FindMisconfigurations(detectedSettings, expectedSettings);
         var warnings = GenerateWarnings(detectedVersion, expectedSettings, misconfigurations);
@@ -59,21 +65,53 @@ public partial class SettingsScanner : ISettingsScanner
         };
     }
 
-    private Dictionary<string, string> ExtractSettings(string content)
+    /// <summary>
+    /// Extracts settings from lines in the format <c>SettingName: value</c>,
+    /// e.g. "MemoryManager: false".
+    /// </summary>
+    /// <remarks>
+    /// Each line is split once at its first colon. Names are limited to letters, digits and
+    /// underscores, so other text in the segment that happens to contain a colon is skipped.
+    /// </remarks>
+    private static Dictionary<string, string> ExtractSettings(IReadOnlyList<string> lines)
     {
         var settings = new Dictionary<string, string>(StringComparer.OrdinalIgnoreCase);
-        var matches = SettingLineRegex().Matches(content);
 
-        foreach (Match match in matches)
+        foreach (var line in lines)
         {
-            var key = match.Groups[1].Value;
-            var value = match.Groups[2].Value;
-            settings[key] = value;
+            var span = line.AsSpan();
+            var colonIndex = span.IndexOf(':');
+            if (colonIndex < 0)
+            {
+                continue;
+            }
+
+            var key = span[..colonIndex].Trim();
+            var value = span[(colonIndex + 1)..].Trim();
+            if (key.IsEmpty || value.IsEmpty || !IsSettingName(key))
+            {
+                continue;
+            }
+
+            settings[key.ToString()] = value.ToString();
         }
 
         return settings;
     }
 
+    private static bool IsSettingName(ReadOnlySpan<char> name)
+    {
+        foreach (var c in name)
+        {
+            if (!char.IsAsciiLetterOrDigit(c) && c != '_')
+            {
+                return false;
+            }
+        }
+
+        return true;
+    }
+
     private string? ExtractVersion(string content)
     {
         var match = VersionRegex().Match(content);
@@ -142,8 +180,8 @@ public partial class SettingsScanner : ISettingsScanner
         }
 
         // Extract version numbers from strings like "Buffout 4 v1.26.2"
-        var detectedMatch = Regex.Match(detectedVersion, @"v([\d.]+)");
-        var latestMatch = Regex.Match(latestVersion, @"[\d.]+");
+        var detectedMatch = DetectedVersionNumberRegex().Match(detectedVersion);
+        var latestMatch = VersionNumberRegex().Match(latestVersion);
 
         if (!detectedMatch.Success || !latestMatch.Success)
         {
@@ -1,29 +1,81 @@
 using System.Data;
+using System.Runtime.CompilerServices;
 using Microsoft.Data.Sqlite;
+using SQLitePCL;
 
 namespace Scanner111.Common.Services.Database;
 
 /// <summary>
 /// SQLite implementation of <see cref="IDatabaseConnectionFactory"/>.
 /// </summary>
+/// <remarks>
+/// The factory is registered as a singleton and every connection it creates shares one
+/// connection string, so Microsoft.Data.Sqlite's default connection pool hands back already-open native
+/// connections across scans instead of reopening the database file for every lookup.
+/// Each native connection is also tuned once for read-only lookups with a larger page cache,
+/// memory-mapped I/O and in-memory temporary storage; the pragmas stick to the native handle, so
+/// pooled reopens skip them.
+/// </remarks>
 public class SqliteDatabaseConnectionFactory : IDatabaseConnectionFactory
 {
+    /// <summary>
+    /// Per-connection pragmas for lookup workloads. The journal mode is left alone because the
+    /// database is opened read-only and changing it would rewrite the user's database file.
+    /// </summary>
+    private const string ConnectionPragmas =
+        "PRAGMA query_only = 1; " +
+        "PRAGMA temp_store = MEMORY; " +
+        "PRAGMA cache_size = -64000; " +
+        "PRAGMA mmap_size = 268435456;";
+
     private readonly string _connectionString;
 
+    /// <summary>
+    /// Native connections that have already had <see cref="ConnectionPragmas"/> applied. Weakly
+    /// keyed so handles closed by the pool are not kept alive.
+    /// </summary>
+    private readonly ConditionalWeakTable<sqlite3, object> _tunedHandles = new();
+
     /// <summary>
     /// Initializes a new instance of the <see cref="SqliteDatabaseConnectionFactory"/> class.
     /// </summary>
     /// <param name="dbPath">The path to the SQLite database file.</param>
     public SqliteDatabaseConnectionFactory(string dbPath)
     {
-        _connectionString = $"Data Source={dbPath};Mode=ReadOnly";
+        _connectionString = new SqliteConnectionStringBuilder
+        {
+            DataSource = dbPath,
+            Mode = SqliteOpenMode.ReadOnly
+        }.ToString();
     }
 
     /// <inheritdoc/>
     public async Task<IDbConnection> CreateConnectionAsync(CancellationToken ct = default)
     {
         var connection = new SqliteConnection(_connectionString);
-        await connection.OpenAsync(ct).ConfigureAwait(false);
+        try
+        {
+            await connection.OpenAsync(ct).ConfigureAwait(false);
+
+            var handle = connection.Handle;
+            if (handle is null || !_tunedHandles.TryGetValue(handle, out _))
+            {
+                await using var command = connection.CreateCommand();
+                command.CommandText = ConnectionPragmas;
+                await command.ExecuteNonQueryAsync(ct).ConfigureAwait(false);
+
+                if (handle is not null)
+                {
+                    _tunedHandles.AddOrUpdate(handle, handle);
+                }
+            }
+        }
+        catch
+        {
+            await connection.DisposeAsync().ConfigureAwait(false);
+            throw;
+        }
+
         return connection;
     }
 }
@@ -1,3 +1,4 @@
+using System.Buffers;
 using System.Text;
 
 namespace Scanner111.Common.Services.FileIO;
@@ -14,31 +15,208 @@ public class FileIOService : IFileIOService
     /// <inheritdoc/>
     public async Task<string> ReadFileAsync(string path, CancellationToken cancellationToken = default)
     {
-        await using var stream = new FileStream(
+        // Read the raw bytes into a pooled buffer and decode them once, rather than decoding
+        // through a small-buffered StreamReader or allocating a fresh byte[] for every log.
+        using var handle = File.OpenHandle(
             path,
             FileMode.Open,
             FileAccess.Read,
             FileShare.Read,
-            bufferSize: 4096,
-            useAsync: true);
+            FileOptions.Asynchronous | FileOptions.SequentialScan);
 
-        using var reader = new StreamReader(stream, Utf8WithErrorHandling);
-        return await reader.ReadToEndAsync(cancellationToken).ConfigureAwait(false);
+        var length = RandomAccess.GetLength(handle);
+        if (length > Array.MaxLength)
+        {
+            throw new IOException($"File is too large to read into memory: {path}");
+        }
+
+        var buffer = ArrayPool<byte>.Shared.Rent((int)length);
+        try
+        {
+            var total = 0;
+            while (total < length)
+            {
+                var read = await RandomAccess.ReadAsync(
+                    handle,
+                    buffer.AsMemory(total, (int)length - total),
+                    total,
+                    cancellationToken).ConfigureAwait(false);
+
+                if (read == 0)
+                {
+                    break;
+                }
+
+                total += read;
+            }
+
+            return Decode(buffer.AsSpan(0, total));
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(buffer);
+        }
+    }
+
+    /// <inheritdoc/>
+    public Task WriteFileAsync(string path, string content, CancellationToken cancellationToken = default)
+    {
+        // Whole-content writes are one-shot, so let the runtime encode and write in a single
+        // operation instead of pushing the string through a small-buffered StreamWriter.
+        return File.WriteAllTextAsync(path, content, Utf8WithErrorHandling, cancellationToken);
+    }
+
+    /// <inheritdoc/>
+    public Task WriteLinesAsync(string path, IEnumerable<string> lines, CancellationToken cancellationToken = default)
+    {
+        return WriteLinesAsync(path, lines, "\n", cancellationToken);
     }
 
     /// <inheritdoc/>
-    public async Task WriteFileAsync(string path, string content, CancellationToken cancellationToken = default)
+    public async Task WriteLinesAsync(
+        string path,
+        IEnumerable<string> lines,
+        string separator,
+        CancellationToken cancellationToken = default)
+    {
+        var lineList = lines as IReadOnlyList<string> ?? lines.ToList();
+
+        // Encode every line into one pooled buffer and issue a single write, instead of pushing
+        // each line through a StreamWriter with its own awaited write call.
+        var separatorByteCount = Utf8WithErrorHandling.GetByteCount(separator);
+        var byteCount = checked(Math.Max(lineList.Count - 1, 0) * separatorByteCount);
+        foreach (var line in lineList)
+        {
+            byteCount = checked(byteCount + Utf8WithErrorHandling.GetByteCount(line));
+        }
+
+        var buffer = ArrayPool<byte>.Shared.Rent(byteCount);
+        try
+        {
+            var written = 0;
+            for (var i = 0; i < lineList.Count; i++)
+            {
+                if (i > 0)
+                {
+                    written += Utf8WithErrorHandling.GetBytes(separator, buffer.AsSpan(written));
+                }
+
+                written += Utf8WithErrorHandling.GetBytes(lineList[i], buffer.AsSpan(written));
+            }
+
+            var content = buffer.AsMemory(0, written);
+            if (await HasSameContentAsync(path, content, cancellationToken).ConfigureAwait(false))
+            {
+                return;
+            }
+
+            // Write a sibling temp file and swap it in, so an interrupted write never leaves the
+            // target holding a mix of old and new content
+            var tempPath = $"{path}.{Guid.NewGuid():N}.tmp";
+            try
+            {
+                using (var handle = File.OpenHandle(
+                           tempPath,
+                           FileMode.CreateNew,
+                           FileAccess.Write,
+                           FileShare.None,
+                           FileOptions.Asynchronous,
+                           preallocationSize: written))
+                {
+                    await RandomAccess.WriteAsync(handle, content, 0, cancellationToken).ConfigureAwait(false);
+                }
+
+                File.Move(tempPath, path, overwrite: true);
+            }
+            catch
+            {
+                File.Delete(tempPath);
+                throw;
+            }
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(buffer);
+        }
+    }
+
+    /// <summary>
+    /// Checks whether the file at <paramref name="path"/> already contains exactly
+    /// <paramref name="content"/>. Only files of the same length are read back, so differing
+    /// files cost a single length query.
+    /// </summary>
+    private static async Task<bool> HasSameContentAsync(
+        string path,
+        ReadOnlyMemory<byte> content,
+        CancellationToken cancellationToken)
     {
-        await using var stream = new FileStream(
+        if (!File.Exists(path))
+        {
+            return false;
+        }
+
+        using var handle = File.OpenHandle(
             path,
-            FileMode.Create,
-            FileAccess.Write,
-            FileShare.None,
-            bufferSize: 4096,
-            useAsync: true);
-
-        await using var writer = new StreamWriter(stream, Utf8WithErrorHandling);
-        await writer.WriteAsync(content.AsMemory(), cancellationToken).ConfigureAwait(false);
+            FileMode.Open,
+            FileAccess.Read,
+            FileShare.Read,
+            FileOptions.Asynchronous);
+
+        if (RandomAccess.GetLength(handle) != content.Length)
+        {
+            return false;
+        }
+
+        var existing = ArrayPool<byte>.Shared.Rent(content.Length);
+        try
+        {
+            var total = 0;
+            while (total < content.Length)
+            {
+                var read = await RandomAccess.ReadAsync(
+                    handle,
+                    existing.AsMemory(total, content.Length - total),
+                    total,
+                    cancellationToken).ConfigureAwait(false);
+
+                if (read == 0)
+                {
+                    return false;
+                }
+
+                total += read;
+            }
+
+            return existing.AsSpan(0, total).SequenceEqual(content.Span);
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(existing);
+        }
+    }
+
+    /// <summary>
+    /// Decodes file content, honouring a byte order mark the same way <see cref="StreamReader"/> does
+    /// and falling back to lenient UTF-8.
+    /// </summary>
+    private static string Decode(ReadOnlySpan<byte> bytes)
+    {
+        if (bytes.StartsWith(Encoding.UTF8.Preamble))
+        {
+            return Utf8WithErrorHandling.GetString(bytes[Encoding.UTF8.Preamble.Length..]);
+        }
+
+        if (bytes.StartsWith(Encoding.Unicode.Preamble))
+        {
+            return Encoding.Unicode.GetString(bytes[Encoding.Unicode.Preamble.Length..]);
+        }
+
+        if (bytes.StartsWith(Encoding.BigEndianUnicode.Preamble))
+        {
+            return Encoding.BigEndianUnicode.GetString(bytes[Encoding.BigEndianUnicode.Preamble.Length..]);
+        }
+
+        return Utf8WithErrorHandling.GetString(bytes);
     }
 
     /// <inheritdoc/>
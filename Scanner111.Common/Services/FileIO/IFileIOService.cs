@@ -25,6 +25,38 @@ public interface IFileIOService
     /// <exception cref="UnauthorizedAccessException">The caller does not have permission to write the file.</exception>
     Task WriteFileAsync(string path, string content, CancellationToken cancellationToken = default);
 
+    /// <summary>
+    /// Writes a sequence of lines to a file asynchronously, separated by <c>\n</c>.
+    /// </summary>
+    /// <remarks>
+    /// Callers do not need to join the lines into a single string first. No trailing newline is
+    /// written after the last line. If the file already holds exactly the same content it is left
+    /// untouched, so re-scanning unchanged logs does not rewrite their reports. An existing file of
+    /// the same length is read back to make that check, and a skipped write keeps its last-write
+    /// time. Otherwise the content is written to a temporary file that then replaces the target.
+    /// </remarks>
+    /// <param name="path">The absolute path to the file to write.</param>
+    /// <param name="lines">The lines to write to the file.</param>
+    /// <param name="cancellationToken">A token to cancel the operation.</param>
+    /// <returns>A task representing the asynchronous operation.</returns>
+    /// <exception cref="UnauthorizedAccessException">The caller does not have permission to write the file.</exception>
+    Task WriteLinesAsync(string path, IEnumerable<string> lines, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Writes a sequence of lines to a file asynchronously, separated by <paramref name="separator"/>.
+    /// </summary>
+    /// <remarks>
+    /// Behaves like <see cref="WriteLinesAsync(string, IEnumerable{string}, CancellationToken)"/>
+    /// with a caller-chosen line separator, such as <see cref="Environment.NewLine"/>.
+    /// </remarks>
+    /// <param name="path">The absolute path to the file to write.</param>
+    /// <param name="lines">The lines to write to the file.</param>
+    /// <param name="separator">The text written between consecutive lines.</param>
+    /// <param name="cancellationToken">A token to cancel the operation.</param>
+    /// <returns>A task representing the asynchronous operation.</returns>
+    /// <exception cref="UnauthorizedAccessException">The caller does not have permission to write the file.</exception>
+    Task WriteLinesAsync(string path, IEnumerable<string> lines, string separator, CancellationToken cancellationToken = default);
+
     /// <summary>
     /// Checks if a file exists asynchronously.
     /// </summary>
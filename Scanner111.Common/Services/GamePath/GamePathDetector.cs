@@ -146,31 +146,11 @@ public sealed class GamePathDetector : IGamePathDetector
                 return null;
             }
 
-            // Read the file and look for the plugin directory line
-            await using var stream = new FileStream(
-                xseLogPath,
-                FileMode.Open,
-                FileAccess.Read,
-                FileShare.Read,
-                bufferSize: 4096,
-                useAsync: true);
-
-            using var reader = new StreamReader(stream);
-
-            string? line;
-            while ((line = await reader.ReadLineAsync(cancellationToken).ConfigureAwait(false)) != null)
-            {
-                cancellationToken.ThrowIfCancellationRequested();
-
-                if (line.StartsWith("plugin directory", StringComparison.OrdinalIgnoreCase))
-                {
-                    var path = ExtractPathFromPluginDirectory(line, xseAcronymBase);
-                    if (!string.IsNullOrEmpty(path) && ValidateGamePath(gameType, path))
-                    {
-                        return path;
-                    }
-                }
-            }
+            // Read the file and look for the plugin directory line. The log is scanned with one
+            // thread-pool hop and synchronous buffered reads rather than an awaited read per line.
+            return await Task.Run(
+                () => FindPathInXseLog(gameType, xseLogPath, xseAcronymBase, cancellationToken),
+                cancellationToken).ConfigureAwait(false);
         }
         catch (IOException ex)
         {
@@ -272,6 +252,40 @@ public sealed class GamePathDetector : IGamePathDetector
         return Task.FromResult<string?>(null);
     }
 
+    /// <summary>
+    /// Scans an XSE log for a "plugin directory" line that points at a valid game folder.
+    /// </summary>
+    private string? FindPathInXseLog(
+        GameType gameType,
+        string xseLogPath,
+        string xseAcronymBase,
+        CancellationToken cancellationToken)
+    {
+        using var reader = new StreamReader(new FileStream(
+            xseLogPath,
+            FileMode.Open,
+            FileAccess.Read,
+            FileShare.Read,
+            bufferSize: 4096,
+            FileOptions.SequentialScan));
+
+        while (reader.ReadLine() is { } line)
+        {
+            cancellationToken.ThrowIfCancellationRequested();
+
+            if (line.StartsWith("plugin directory", StringComparison.OrdinalIgnoreCase))
+            {
+                var path = ExtractPathFromPluginDirectory(line, xseAcronymBase);
+                if (!string.IsNullOrEmpty(path) && ValidateGamePath(gameType, path))
+                {
+                    return path;
+                }
+            }
+        }
+
+        return null;
+    }
+
     /// <summary>
     /// Reads the game installation path from the Bethesda Softworks registry key.
     /// </summary>
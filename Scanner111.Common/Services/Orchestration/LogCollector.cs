@@ -8,6 +8,10 @@ namespace Scanner111.Common.Services.Orchestration;
 /// </summary>
 public class LogCollector : ILogCollector
 {
+    // Paths that differ only by case name the same file on Windows
+    private static readonly StringComparer PathComparer =
+        OperatingSystem.IsWindows() ? StringComparer.OrdinalIgnoreCase : StringComparer.Ordinal;
+
     private LogCollectorConfiguration _configuration = LogCollectorConfiguration.Empty;
 
     /// <inheritdoc/>
@@ -115,10 +119,20 @@ public class LogCollector : ILogCollector
         var allMovedReports = new List<string>();
         var allErrors = new List<LogCollectionError>();
 
+        // Lists built from overlapping scans can name the same log more than once; each file
+        // only needs to be checked and moved once
+        var seenPaths = new HashSet<string>(PathComparer);
+
         foreach (var crashLogPath in crashLogPaths)
         {
             cancellationToken.ThrowIfCancellationRequested();
 
+            var pathKey = string.IsNullOrWhiteSpace(crashLogPath) ? crashLogPath : Path.GetFullPath(crashLogPath);
+            if (!seenPaths.Add(pathKey))
+            {
+                continue;
+            }
+
             var result = await MoveUnsolvedLogAsync(crashLogPath, cancellationToken).ConfigureAwait(false);
 
             allMovedCrashLogs.AddRange(result.MovedCrashLogs);
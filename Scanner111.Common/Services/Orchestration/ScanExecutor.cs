@@ -3,6 +3,7 @@ using System.Diagnostics;
 using Microsoft.Extensions.Logging;
 using Scanner111.Common.Models.Analysis;
 using Scanner111.Common.Models.Configuration;
+using Scanner111.Common.Models.Reporting;
 
 namespace Scanner111.Common.Services.Orchestration;
 
@@ -11,6 +12,17 @@ namespace Scanner111.Common.Services.Orchestration;
 /// </summary>
 public class ScanExecutor : IScanExecutor
 {
+    /// <summary>
+    /// Workers per logical processor when the concurrency limit is chosen automatically.
+    /// Log processing mixes file I/O with parsing, so a few workers per core keep every core busy.
+    /// </summary>
+    private const int AutoConcurrencyPerProcessor = 4;
+
+    /// <summary>
+    /// Lower bound for the automatic concurrency limit on machines with few cores.
+    /// </summary>
+    private const int MinimumAutoConcurrency = 16;
+
     private readonly ILogger<ScanExecutor> _logger;
     private readonly Func<ILogOrchestrator> _orchestratorFactory;
 
@@ -45,8 +57,11 @@ public class ScanExecutor : IScanExecutor
 
         _logger.LogInformation("Starting batch scan in '{ScanPath}'", config.ScanPath);
 
-        // Discover files
-        var logFiles = Directory.GetFiles(config.ScanPath, "crash-*.log", SearchOption.TopDirectoryOnly);
+        // Discover files off the calling thread; callers are frequently UI threads and
+        // directory enumeration blocks on slow or network drives.
+        var logFiles = await Task.Run(
+            () => Directory.GetFiles(config.ScanPath, "crash-*.log", SearchOption.TopDirectoryOnly),
+            ct).ConfigureAwait(false);
 
         var totalFiles = logFiles.Length;
         _logger.LogInformation("Discovered {FileCount} crash log files", totalFiles);
@@ -60,66 +75,87 @@ public class ScanExecutor : IScanExecutor
         var stopwatch = Stopwatch.StartNew();
 
         var processedCount = 0;
+        var scannedCount = 0;
+        var failedCount = 0;
         var failedLogs = new ConcurrentBag<string>();
         var processedFiles = new ConcurrentBag<string>();
         var errorMessages = new ConcurrentBag<string>();
+        var reports = new ConcurrentDictionary<string, ReportFragment>();
+
+        // Bound concurrency to a fixed set of workers instead of queueing one task per file on a
+        // semaphore; never start more workers than there are files to process.
+        var maxConcurrent = Math.Max(1, Math.Min(GetConcurrencyLimit(config.MaxConcurrent), Math.Max(totalFiles, 1)));
+        _logger.LogDebug("Concurrency limit set to {MaxConcurrent}", maxConcurrent);
 
-        // Set up concurrency control
-        using var semaphore = new SemaphoreSlim(config.MaxConcurrent, config.MaxConcurrent);
-        _logger.LogDebug("Concurrency limit set to {MaxConcurrent}", config.MaxConcurrent);
+        var parallelOptions = new ParallelOptions
+        {
+            MaxDegreeOfParallelism = maxConcurrent,
+            CancellationToken = ct
+        };
 
-        var tasks = new List<Task>();
+        // One orchestrator serves the whole batch: it is stateless, so resolving a new instance
+        // (and its dependency graph) for every log only adds per-file overhead.
+        var orchestrator = _orchestratorFactory();
 
-        foreach (var logFile in logFiles)
+        // Parallel.ForEachAsync runs each body on the thread pool, so reading, parsing and
+        // analysis never execute on the caller's thread.
+        await Parallel.ForEachAsync(logFiles, parallelOptions, async (logFile, token) =>
         {
-            tasks.Add(ProcessLogWithSemaphoreAsync(
+            var succeeded = await ProcessLogAsync(
+                orchestrator,
                 logFile,
                 config,
-                semaphore,
                 failedLogs,
                 processedFiles,
                 errorMessages,
-                () =>
-                {
-                    var count = Interlocked.Increment(ref processedCount);
-                    progress?.Report(new ScanProgress
-                    {
-                        FilesProcessed = count,
-                        TotalFiles = totalFiles,
-                        CurrentFile = Path.GetFileName(logFile),
-                        Statistics = new ScanStatistics
-                        {
-                            Scanned = processedFiles.Count,
-                            Failed = failedLogs.Count,
-                            TotalFiles = totalFiles,
-                            ScanStartTime = startTime
-                        }
-                    });
-                },
-                ct));
-        }
+                reports,
+                token).ConfigureAwait(false);
+
+            // Track totals with plain counters: ConcurrentBag.Count takes every per-thread lock,
+            // which would serialize the workers on each progress report.
+            if (succeeded)
+            {
+                Interlocked.Increment(ref scannedCount);
+            }
+            else
+            {
+                Interlocked.Increment(ref failedCount);
+            }
 
-        await Task.WhenAll(tasks).ConfigureAwait(false);
+            var count = Interlocked.Increment(ref processedCount);
+            progress?.Report(new ScanProgress
+            {
+                FilesProcessed = count,
+                TotalFiles = totalFiles,
+                CurrentFile = Path.GetFileName(logFile),
+                Statistics = new ScanStatistics
+                {
+                    Scanned = Volatile.Read(ref scannedCount),
+                    Failed = Volatile.Read(ref failedCount),
+                    TotalFiles = totalFiles,
+                    ScanStartTime = startTime
+                }
+            });
+        }).ConfigureAwait(false);
 
         stopwatch.Stop();
-        var failedCount = failedLogs.Count;
 
         if (failedCount > 0)
         {
             _logger.LogWarning("Batch scan completed: {ProcessedCount} processed, {FailedCount} failed in {Duration:F2}s",
-                processedFiles.Count, failedCount, stopwatch.Elapsed.TotalSeconds);
+                scannedCount, failedCount, stopwatch.Elapsed.TotalSeconds);
         }
         else
         {
             _logger.LogInformation("Batch scan completed: {ProcessedCount} files processed in {Duration:F2}s",
-                processedFiles.Count, stopwatch.Elapsed.TotalSeconds);
+                scannedCount, stopwatch.Elapsed.TotalSeconds);
         }
 
         return new ScanResult
         {
             Statistics = new ScanStatistics
             {
-                Scanned = processedFiles.Count,
+                Scanned = scannedCount,
                 Failed = failedCount,
                 TotalFiles = totalFiles,
                 ScanStartTime = startTime
@@ -127,44 +163,58 @@ public class ScanExecutor : IScanExecutor
             FailedLogs = failedLogs.ToList(),
             ProcessedFiles = processedFiles.ToList(),
             ErrorMessages = errorMessages.ToList(),
+            Reports = reports,
             ScanDuration = DateTime.UtcNow - startTime
         };
     }
 
-    private async Task ProcessLogWithSemaphoreAsync(
+    /// <summary>
+    /// Resolves the configured concurrency limit. Non-positive values select an automatic limit
+    /// that scales with the processor count, so many-core machines are not held to a fixed cap.
+    /// </summary>
+    private static int GetConcurrencyLimit(int configured)
+    {
+        if (configured > 0)
+        {
+            return configured;
+        }
+
+        return Math.Max(MinimumAutoConcurrency, Environment.ProcessorCount * AutoConcurrencyPerProcessor);
+    }
+
+    private async Task<bool> ProcessLogAsync(
+        ILogOrchestrator orchestrator,
         string logFile,
         ScanConfig config,
-        SemaphoreSlim semaphore,
         ConcurrentBag<string> failedLogs,
         ConcurrentBag<string> processedFiles,
         ConcurrentBag<string> errorMessages,
-        Action onProcessed,
+        ConcurrentDictionary<string, ReportFragment> reports,
         CancellationToken ct)
     {
-        await semaphore.WaitAsync(ct).ConfigureAwait(false);
         var fileName = Path.GetFileName(logFile);
 
         try
         {
-            var orchestrator = _orchestratorFactory();
             var result = await orchestrator.ProcessLogAsync(logFile, config, ct).ConfigureAwait(false);
             processedFiles.Add(logFile);
+            if (config.RetainReports)
+            {
+                reports[logFile] = result.Report;
+            }
 
             // Check for warnings or issues that might count as "failure" or just track valid scans
             // Here we assume if ProcessLogAsync returns, it's "Scanned".
             // If it threw exception, it would be caught below.
             // However, LogOrchestrator catches parsing errors and returns valid object with Warnings.
+            return true;
         }
         catch (Exception ex)
         {
             failedLogs.Add(logFile);
             errorMessages.Add($"Error processing {fileName}: {ex.Message}");
             _logger.LogError(ex, "Error processing crash log '{FileName}'", fileName);
-        }
-        finally
-        {
-            semaphore.Release();
-            onProcessed();
+            return false;
         }
     }
 }
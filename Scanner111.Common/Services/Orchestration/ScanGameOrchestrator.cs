@@ -138,8 +138,12 @@ public sealed class ScanGameOrchestrator : IScanGameOrchestrator
 
         if (result.GeneratedReport != null && result.GeneratedReport.HasContent)
         {
-            var reportContent = string.Join(Environment.NewLine, result.GeneratedReport.Lines);
-            await _fileIO.WriteFileAsync(reportPath, reportContent, cancellationToken).ConfigureAwait(false);
+            // Encode the report lines straight into the file buffer instead of joining them first
+            await _fileIO.WriteLinesAsync(
+                reportPath,
+                result.GeneratedReport.Lines,
+                Environment.NewLine,
+                cancellationToken).ConfigureAwait(false);
         }
 
         return result;
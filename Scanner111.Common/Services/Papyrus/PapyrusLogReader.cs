@@ -17,6 +17,7 @@ public sealed class PapyrusLogReader : IPapyrusLogReader
     private const string StacksPattern = "Dumping Stack";
     private const string WarningPattern = " warning: ";
     private const string ErrorPattern = " error: ";
+    private const int ReadBufferSize = 64 * 1024;
 
     /// <inheritdoc/>
     public long GetFileEndPosition(string logPath)
@@ -47,25 +48,39 @@ public sealed class PapyrusLogReader : IPapyrusLogReader
             throw new FileNotFoundException("Papyrus log file not found.", logPath);
         }
 
+        // Scan the new content with one thread-pool hop and synchronous buffered reads rather than
+        // awaiting an async ReadLineAsync per line; the per-line async overhead dominates for logs
+        // that grow by thousands of short lines between polls.
+        return await Task.Run(
+            () => ScanNewContent(logPath, startPosition, currentStats, cancellationToken),
+            cancellationToken).ConfigureAwait(false);
+    }
+
+    private static PapyrusReadResult ScanNewContent(
+        string logPath,
+        long startPosition,
+        PapyrusStats currentStats,
+        CancellationToken cancellationToken)
+    {
         var dumps = currentStats.Dumps;
         var stacks = currentStats.Stacks;
         var warnings = currentStats.Warnings;
         var errors = currentStats.Errors;
 
-        await using var stream = new FileStream(
+        using var stream = new FileStream(
             logPath,
             FileMode.Open,
             FileAccess.Read,
             FileShare.ReadWrite, // Allow reading while game is running
-            bufferSize: 4096,
-            useAsync: true);
+            bufferSize: ReadBufferSize,
+            FileOptions.SequentialScan);
 
         // Seek to the start position
         stream.Seek(startPosition, SeekOrigin.Begin);
 
         using var reader = new StreamReader(stream, Encoding.UTF8, detectEncodingFromByteOrderMarks: true);
 
-        while (await reader.ReadLineAsync(cancellationToken).ConfigureAwait(false) is { } line)
+        while (reader.ReadLine() is { } line)
         {
             cancellationToken.ThrowIfCancellationRequested();
 
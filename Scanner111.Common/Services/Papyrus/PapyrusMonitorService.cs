@@ -103,15 +103,10 @@ public sealed class PapyrusMonitorService : IPapyrusMonitorService
         {
             while (await timer.WaitForNextTickAsync(cancellationToken).ConfigureAwait(false))
             {
-                await ReadAndEmitAsync(logPath, currentPosition, currentStats, cancellationToken)
-                    .ContinueWith(task =>
-                    {
-                        if (task.IsCompletedSuccessfully)
-                        {
-                            (currentStats, currentPosition) = task.Result;
-                        }
-                    }, cancellationToken)
-                    .ConfigureAwait(false);
+                // ReadAndEmitAsync handles its own failures and returns the previous state, so the
+                // result can be awaited directly without a continuation allocated per poll
+                (currentStats, currentPosition) = await ReadAndEmitAsync(
+                    logPath, currentPosition, currentStats, cancellationToken).ConfigureAwait(false);
             }
         }
         catch (OperationCanceledException)
@@ -9,6 +9,12 @@ namespace Scanner111.Common.Services.Parsing;
 /// </summary>
 public partial class CrashHeaderParser
 {
+    /// <summary>
+    /// Number of leading characters searched for header fields; header information is always
+    /// at the beginning of the log.
+    /// </summary>
+    private const int HeaderScanLength = 2000;
+
     /// <summary>
     /// Regex to match Fallout 4 version.
     /// Example: "Fallout 4 v1.10.163.0"
@@ -56,15 +62,13 @@ public partial class CrashHeaderParser
             return null;
         }
 
-        // Only parse the first 2000 characters for performance
-        // (header information is always at the beginning)
-        var headerSection = logContent.Length > 2000
-            ? logContent[..2000]
-            : logContent;
+        // Only parse the header for performance. The regexes are bounded to the leading
+        // characters in place, so the header is not copied out into its own string first.
+        var headerLength = Math.Min(logContent.Length, HeaderScanLength);
 
-        var gameVersion = ExtractGameVersion(headerSection);
-        var crashGeneratorVersion = ExtractCrashGeneratorVersion(headerSection);
-        var mainError = ExtractMainError(headerSection);
+        var gameVersion = ExtractGameVersion(logContent, headerLength);
+        var crashGeneratorVersion = ExtractCrashGeneratorVersion(logContent, headerLength);
+        var mainError = ExtractMainError(logContent, headerLength);
         var timestamp = ExtractTimestamp(logContent); // Use full content for timestamp
 
         // At minimum, we need either a game version or crash generator version
@@ -82,15 +86,15 @@ public partial class CrashHeaderParser
         };
     }
 
-    private string ExtractGameVersion(string headerSection)
+    private string ExtractGameVersion(string logContent, int headerLength)
     {
-        var fo4Match = Fallout4VersionRegex().Match(headerSection);
+        var fo4Match = Fallout4VersionRegex().Match(logContent, 0, headerLength);
         if (fo4Match.Success)
         {
             return fo4Match.Groups[1].Value;
         }
 
-        var skyrimMatch = SkyrimVersionRegex().Match(headerSection);
+        var skyrimMatch = SkyrimVersionRegex().Match(logContent, 0, headerLength);
         if (skyrimMatch.Success)
         {
             return skyrimMatch.Groups[1].Value;
@@ -99,9 +103,9 @@ public partial class CrashHeaderParser
         return string.Empty;
     }
 
-    private string ExtractCrashGeneratorVersion(string headerSection)
+    private string ExtractCrashGeneratorVersion(string logContent, int headerLength)
     {
-        var match = CrashGeneratorRegex().Match(headerSection);
+        var match = CrashGeneratorRegex().Match(logContent, 0, headerLength);
         if (match.Success)
         {
             var generatorName = match.Groups[1].Value;
@@ -112,9 +116,9 @@ public partial class CrashHeaderParser
         return string.Empty;
     }
 
-    private string ExtractMainError(string headerSection)
+    private string ExtractMainError(string logContent, int headerLength)
     {
-        var match = MainErrorRegex().Match(headerSection);
+        var match = MainErrorRegex().Match(logContent, 0, headerLength);
         return match.Success ? match.Groups[1].Value : string.Empty;
     }
 
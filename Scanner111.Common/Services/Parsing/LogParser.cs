@@ -93,10 +93,7 @@ public partial class LogParser : ILogParser
                 ? matches[i + 1].Index
                 : logContent.Length;
 
-            var sectionContent = logContent[startIndex..endIndex];
-            var lines = sectionContent.Split('\n', StringSplitOptions.None)
-                .Select(line => line.TrimEnd('\r'))
-                .ToList();
+            var lines = SplitLines(logContent.AsSpan(startIndex, endIndex - startIndex));
 
             // Extract segment name from the match
             string segmentName;
@@ -108,7 +105,7 @@ public partial class LogParser : ILogParser
             else
             {
                 // Colon format: SYSTEM SPECS:, MODULES:, etc.
-                segmentName = startMatch.Value.TrimEnd(':').Trim();
+                segmentName = GetColonSegmentName(startMatch.ValueSpan);
             }
 
             segments.Add(new LogSegment
@@ -122,4 +119,50 @@ public partial class LogParser : ILogParser
 
         return segments;
     }
+
+    /// <summary>
+    /// Maps a colon-style header to its segment name.
+    /// </summary>
+    /// <remarks>
+    /// The header regex only matches a fixed set of colon headers, so the names are returned as
+    /// interned literals instead of being trimmed into a new string for every log. Comparisons
+    /// against the same literals elsewhere then hit the reference-equality fast path.
+    /// </remarks>
+    private static string GetColonSegmentName(ReadOnlySpan<char> header) => header switch
+    {
+        "SYSTEM SPECS:" => "SYSTEM SPECS",
+        "PROBABLE CALL STACK:" => "PROBABLE CALL STACK",
+        "MODULES:" => "MODULES",
+        "PLUGINS:" => "PLUGINS",
+        "XSE PLUGINS:" => "XSE PLUGINS",
+        _ => header.TrimEnd(':').Trim().ToString()
+    };
+
+    /// <summary>
+    /// Splits a block of text on '\n' and strips trailing '\r' characters in a single pass.
+    /// </summary>
+    /// <remarks>
+    /// Equivalent to <c>Split('\n').Select(l => l.TrimEnd('\r'))</c>, including the trailing empty
+    /// line when the block ends with a newline, but slices lines straight out of the source
+    /// without materializing the section substring or an intermediate array. The list is sized
+    /// from a vectorized newline count up front, so large sections never regrow and copy it.
+    /// </remarks>
+    private static List<string> SplitLines(ReadOnlySpan<char> content)
+    {
+        var lines = new List<string>(content.Count('\n') + 1);
+
+        while (true)
+        {
+            var newlineIndex = content.IndexOf('\n');
+            var line = newlineIndex >= 0 ? content[..newlineIndex] : content;
+            lines.Add(line.TrimEnd('\r').ToString());
+
+            if (newlineIndex < 0)
+            {
+                return lines;
+            }
+
+            content = content[(newlineIndex + 1)..];
+        }
+    }
 }
@@ -16,6 +16,14 @@ public static partial class LogReformatter
     [GeneratedRegex(@"^\s*(\d+)\s+(\d+)\s+([A-Fa-f0-9:]+)\s+(.+?)$", RegexOptions.Multiline)]
     private static partial Regex LoadOrderSpacesRegex();
 
+    /// <summary>
+    /// Replacement pattern for <see cref="LoadOrderSpacesRegex"/>: "  [Index] [LoadOrder] [FormID] [PluginName]".
+    /// </summary>
+    private const string LoadOrderReplacement = "  $1 $2 $3 $4";
+
+    private const string PluginsHeader = "PLUGINS:";
+    private const string PluginsHeaderLine = "\n" + PluginsHeader;
+
     /// <summary>
     /// Reformats Buffout 4 load order by normalizing spacing between columns.
     /// </summary>
@@ -28,16 +36,29 @@ public static partial class LogReformatter
             return logContent;
         }
 
-        // Replace excessive spaces with single spaces between columns
-        return LoadOrderSpacesRegex().Replace(logContent, match =>
+        // Normalize to single spaces between columns with a substitution pattern, so the regex
+        // engine builds each replacement directly instead of calling back per match. The load
+        // order is a suffix of a full log, so start the scan at the PLUGINS: header when present
+        // and leave everything before it untouched.
+        return LoadOrderSpacesRegex().Replace(
+            logContent,
+            LoadOrderReplacement,
+            count: -1,
+            startat: FindPluginsSectionStart(logContent));
+    }
+
+    /// <summary>
+    /// Returns the offset of the PLUGINS: header line, or 0 when the content has none
+    /// (for example, when only the load order lines were passed in).
+    /// </summary>
+    private static int FindPluginsSectionStart(string logContent)
+    {
+        if (logContent.StartsWith(PluginsHeader, StringComparison.Ordinal))
         {
-            var index = match.Groups[1].Value;
-            var loadOrder = match.Groups[2].Value;
-            var formId = match.Groups[3].Value;
-            var pluginName = match.Groups[4].Value;
-
-            // Normalize to single space between columns
-            return $"  {index} {loadOrder} {formId} {pluginName}";
-        });
+            return 0;
+        }
+
+        var index = logContent.IndexOf(PluginsHeaderLine, StringComparison.Ordinal);
+        return index < 0 ? 0 : index + 1;
     }
 }
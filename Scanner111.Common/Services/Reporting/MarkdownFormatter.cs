@@ -5,6 +5,8 @@ namespace Scanner111.Common.Services.Reporting;
 /// </summary>
 public static class MarkdownFormatter
 {
+    private static readonly string[] HeadingPrefixes = ["# ", "## ", "### ", "#### ", "##### ", "###### "];
+
     /// <summary>
     /// Formats text as bold in Markdown.
     /// </summary>
@@ -60,8 +62,7 @@ public static class MarkdownFormatter
     public static string Heading(string text, int level = 1)
     {
         level = Math.Clamp(level, 1, 6);
-        var hashes = new string('#', level);
-        return $"{hashes} {text}";
+        return string.Concat(HeadingPrefixes[level - 1], text);
     }
 
     /// <summary>
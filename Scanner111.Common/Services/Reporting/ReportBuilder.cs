@@ -36,12 +36,13 @@ public class ReportBuilder : IReportBuilder
     /// <inheritdoc/>
     public IReportBuilder AddSection(string sectionName, IEnumerable<string> lines)
     {
-        var linesList = lines.ToList();
-        if (linesList.Count > 0)
+        // Materialize straight into the final list (header, blank line, content) rather than
+        // copying through intermediate lists and arrays on the way to WithHeader.
+        var sectionLines = new List<string> { sectionName, string.Empty };
+        sectionLines.AddRange(lines);
+        if (sectionLines.Count > 2)
         {
-            var fragment = ReportFragment.FromLines(linesList.ToArray());
-            var withHeader = fragment.WithHeader(sectionName);
-            _fragments.Add(withHeader);
+            _fragments.Add(new ReportFragment { Lines = sectionLines });
         }
         return this;
     }
@@ -54,6 +55,20 @@ public class ReportBuilder : IReportBuilder
             return new ReportFragment();
         }
 
-        return _fragments.Aggregate((a, b) => a + b);
+        // Concatenate in a single pass; folding with operator + would re-copy every
+        // previously accumulated line for each fragment.
+        var totalLines = 0;
+        foreach (var fragment in _fragments)
+        {
+            totalLines += fragment.Lines.Count;
+        }
+
+        var lines = new List<string>(totalLines);
+        foreach (var fragment in _fragments)
+        {
+            lines.AddRange(fragment.Lines);
+        }
+
+        return new ReportFragment { Lines = lines };
     }
 }
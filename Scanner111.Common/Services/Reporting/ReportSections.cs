@@ -33,7 +33,7 @@ public static class ReportSections
 
         lines.Add(string.Empty);
 
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     /// <summary>
@@ -74,7 +74,7 @@ public static class ReportSections
             lines.Add(string.Empty);
         }
 
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     /// <summary>
@@ -89,7 +89,8 @@ public static class ReportSections
             return new ReportFragment();
         }
 
-        var lines = new List<string>
+        // Size the list up front: heading, spacer, one line per warning, trailing spacer
+        var lines = new List<string>(warnings.Count + 3)
         {
             "## Warnings",
             string.Empty
@@ -102,7 +103,7 @@ public static class ReportSections
 
         lines.Add(string.Empty);
 
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     /// <summary>
@@ -117,7 +118,7 @@ public static class ReportSections
             return new ReportFragment();
         }
 
-        var lines = new List<string>
+        var lines = new List<string>(recommendations.Count + 3)
         {
             "## Recommended Actions",
             string.Empty
@@ -130,27 +131,25 @@ public static class ReportSections
 
         lines.Add(string.Empty);
 
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
+    /// <summary>
+    /// Standard footer, built once; fragments are immutable, so every report can share it.
+    /// </summary>
+    private static readonly ReportFragment Footer = ReportFragment.FromLines(
+        "---",
+        string.Empty,
+        "*This report was automatically generated by Scanner111*",
+        string.Empty,
+        "For more information on crash log analysis:",
+        "- [Crash Log Reading 101](https://www.nexusmods.com/fallout4/articles/3115)",
+        "- [Common Crash Causes](https://www.nexusmods.com/fallout4/articles/3769)",
+        string.Empty);
+
     /// <summary>
     /// Creates a footer section with additional information and links.
     /// </summary>
     /// <returns>A report fragment containing the standard footer.</returns>
-    public static ReportFragment CreateFooter()
-    {
-        var lines = new[]
-        {
-            "---",
-            string.Empty,
-            "*This report was automatically generated by Scanner111*",
-            string.Empty,
-            "For more information on crash log analysis:",
-            "- [Crash Log Reading 101](https://www.nexusmods.com/fallout4/articles/3115)",
-            "- [Common Crash Causes](https://www.nexusmods.com/fallout4/articles/3769)",
-            string.Empty
-        };
-
-        return ReportFragment.FromLines(lines);
-    }
+    public static ReportFragment CreateFooter() => Footer;
 }
@@ -42,9 +42,9 @@ public class ReportWriter : IReportWriter
         }
 
         var reportPath = GetReportPath(crashLogPath);
-        var content = string.Join("\n", report.Lines);
 
-        await _fileIO.WriteFileAsync(reportPath, content, cancellationToken).ConfigureAwait(false);
+        // Stream the lines straight to disk instead of joining them into one large string first.
+        await _fileIO.WriteLinesAsync(reportPath, report.Lines, cancellationToken).ConfigureAwait(false);
     }
 
     /// <summary>
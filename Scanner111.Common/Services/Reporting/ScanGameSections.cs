@@ -37,7 +37,7 @@ public static class ScanGameSections
             string.Empty
         };
 
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     /// <summary>
@@ -85,22 +85,20 @@ public static class ScanGameSections
         return ReportFragment.FromLines(lines);
     }
 
+    /// <summary>
+    /// The footer never varies, so one immutable fragment is built once and shared.
+    /// </summary>
+    private static readonly ReportFragment Footer = ReportFragment.FromLines(
+        MarkdownFormatter.HorizontalRule(),
+        string.Empty,
+        "*This report was automatically generated by Scanner111*",
+        string.Empty);
+
     /// <summary>
     /// Creates a standard footer for ScanGame reports.
     /// </summary>
     /// <returns>A report fragment containing the footer.</returns>
-    public static ReportFragment CreateFooter()
-    {
-        var lines = new[]
-        {
-            MarkdownFormatter.HorizontalRule(),
-            string.Empty,
-            "*This report was automatically generated by Scanner111*",
-            string.Empty
-        };
-
-        return ReportFragment.FromLines(lines);
-    }
+    public static ReportFragment CreateFooter() => Footer;
 
     #endregion
 
@@ -131,7 +129,7 @@ public static class ScanGameSections
         }
 
         lines.Add(string.Empty);
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     /// <summary>
@@ -159,7 +157,7 @@ public static class ScanGameSections
         }
 
         lines.Add(string.Empty);
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     /// <summary>
@@ -187,7 +185,7 @@ public static class ScanGameSections
         }
 
         lines.Add(string.Empty);
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     /// <summary>
@@ -215,7 +213,7 @@ public static class ScanGameSections
         }
 
         lines.Add(string.Empty);
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     #endregion
@@ -247,7 +245,7 @@ public static class ScanGameSections
         }
 
         lines.Add(string.Empty);
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     /// <summary>
@@ -275,7 +273,7 @@ public static class ScanGameSections
         }
 
         lines.Add(string.Empty);
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     #endregion
@@ -308,7 +306,7 @@ public static class ScanGameSections
         }
 
         lines.Add(string.Empty);
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     /// <summary>
@@ -337,7 +335,7 @@ public static class ScanGameSections
         }
 
         lines.Add(string.Empty);
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     #endregion
@@ -370,7 +368,7 @@ public static class ScanGameSections
         }
 
         lines.Add(string.Empty);
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     /// <summary>
@@ -398,7 +396,7 @@ public static class ScanGameSections
         }
 
         lines.Add(string.Empty);
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     /// <summary>
@@ -424,7 +422,7 @@ public static class ScanGameSections
         }
 
         lines.Add(string.Empty);
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     #endregion
@@ -456,7 +454,7 @@ public static class ScanGameSections
         }
 
         lines.Add(string.Empty);
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     #endregion
@@ -517,7 +515,7 @@ public static class ScanGameSections
             lines.Add(string.Empty);
         }
 
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     /// <summary>
@@ -557,7 +555,7 @@ public static class ScanGameSections
             lines.Add(string.Empty);
         }
 
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     #endregion
@@ -629,7 +627,7 @@ public static class ScanGameSections
         }
 
         lines.Add(string.Empty);
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     #endregion
@@ -669,7 +667,7 @@ public static class ScanGameSections
         }
 
         lines.Add(string.Empty);
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     #endregion
@@ -184,7 +184,7 @@ public sealed class FcxModeHandler : IFcxModeHandler
             lines.Add(string.Empty);
         }
 
-        return ReportFragment.FromLines(lines.ToArray());
+        return new ReportFragment { Lines = lines };
     }
 
     private static string GetSeverityIcon(ConfigIssueSeverity severity)
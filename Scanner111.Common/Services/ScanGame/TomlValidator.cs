@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Text;
 using Scanner111.Common.Models.ScanGame;
 using Tomlyn;
@@ -26,6 +27,9 @@ namespace Scanner111.Common.Services.ScanGame;
 /// </remarks>
 public sealed class TomlValidator : ITomlValidator
 {
+    private readonly ConcurrentDictionary<string, ParsedTomlEntry> _parseCache =
+        new(StringComparer.OrdinalIgnoreCase);
+
     /// <inheritdoc/>
     public async Task<TomlScanResult> ValidateAsync(
         string pluginsPath,
@@ -95,8 +99,7 @@ public sealed class TomlValidator : ITomlValidator
         TomlTable? tomlData;
         try
         {
-            var content = await File.ReadAllTextAsync(configFile, cancellationToken).ConfigureAwait(false);
-            tomlData = Toml.ToModel(content);
+            tomlData = await LoadTomlAsync(configFile, cancellationToken).ConfigureAwait(false);
         }
         catch (Exception ex)
         {
@@ -234,8 +237,7 @@ public sealed class TomlValidator : ITomlValidator
 
         try
         {
-            var content = await File.ReadAllTextAsync(filePath, cancellationToken).ConfigureAwait(false);
-            var tomlData = Toml.ToModel(content);
+            var tomlData = await LoadTomlAsync(filePath, cancellationToken).ConfigureAwait(false);
             var value = GetTomlValue(tomlData, section, key);
 
             if (value is null)
@@ -265,8 +267,7 @@ public sealed class TomlValidator : ITomlValidator
 
         try
         {
-            var content = await File.ReadAllTextAsync(filePath, cancellationToken).ConfigureAwait(false);
-            var tomlData = Toml.ToModel(content);
+            var tomlData = await LoadTomlAsync(filePath, cancellationToken).ConfigureAwait(false);
             var value = GetTomlValue(tomlData, section, key);
             return value?.ToString();
         }
@@ -288,8 +289,7 @@ public sealed class TomlValidator : ITomlValidator
 
         try
         {
-            var content = await File.ReadAllTextAsync(filePath, cancellationToken).ConfigureAwait(false);
-            _ = Toml.ToModel(content);
+            _ = await LoadTomlAsync(filePath, cancellationToken).ConfigureAwait(false);
             return true;
         }
         catch
@@ -298,6 +298,33 @@ public sealed class TomlValidator : ITomlValidator
         }
     }
 
+    /// <summary>
+    /// Loads and parses a TOML file, reusing the previous parse while the file is unchanged.
+    /// </summary>
+    /// <remarks>
+    /// Entries are keyed by path and validated against the file's last write time and size,
+    /// so repeated lookups against the same configuration only pay for a metadata check.
+    /// The returned table is shared between callers and must be treated as read-only.
+    /// </remarks>
+    private async Task<TomlTable> LoadTomlAsync(string filePath, CancellationToken cancellationToken)
+    {
+        var fileInfo = new FileInfo(filePath);
+        var lastWriteTimeUtc = fileInfo.LastWriteTimeUtc;
+        var length = fileInfo.Length;
+
+        if (_parseCache.TryGetValue(filePath, out var cached) &&
+            cached.LastWriteTimeUtc == lastWriteTimeUtc &&
+            cached.Length == length)
+        {
+            return cached.Table;
+        }
+
+        var content = await File.ReadAllTextAsync(filePath, cancellationToken).ConfigureAwait(false);
+        var table = Toml.ToModel(content);
+        _parseCache[filePath] = new ParsedTomlEntry(lastWriteTimeUtc, length, table);
+        return table;
+    }
+
     /// <summary>
     /// Finds the TOML configuration file for the crash generator.
     /// </summary>
@@ -503,6 +530,11 @@ public sealed class TomlValidator : ITomlValidator
         ];
     }
 
+    /// <summary>
+    /// Cached parse result together with the file metadata it was produced from.
+    /// </summary>
+    private sealed record ParsedTomlEntry(DateTime LastWriteTimeUtc, long Length, TomlTable Table);
+
     /// <summary>
     /// Internal record for settings to check with condition.
     /// </summary>
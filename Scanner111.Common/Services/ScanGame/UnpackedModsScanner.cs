@@ -1,3 +1,4 @@
+using System.Buffers;
 using System.Collections.Concurrent;
 using Scanner111.Common.Models.ScanGame;
 
@@ -14,15 +15,12 @@ namespace Scanner111.Common.Services.ScanGame;
 public sealed class UnpackedModsScanner : IUnpackedModsScanner
 {
     /// <summary>
-    /// File name patterns that indicate readme/changelog files to be cleaned up.
+    /// File name patterns that indicate readme/changelog files to be cleaned up, matched in a
+    /// single case-insensitive multi-pattern search.
     /// </summary>
-    private static readonly string[] CleanupFilePatterns =
-    [
-        "readme",
-        "changes",
-        "changelog",
-        "change log"
-    ];
+    private static readonly SearchValues<string> CleanupFilePatterns = SearchValues.Create(
+        ["readme", "changes", "changelog", "change log"],
+        StringComparison.OrdinalIgnoreCase);
 
     /// <summary>
     /// Texture file extensions that should be converted to DDS.
@@ -337,12 +335,11 @@ public sealed class UnpackedModsScanner : IUnpackedModsScanner
             var filePath = Path.Combine(dirInfo.Path, fileName);
             var fileRelative = Path.Combine(relativePath, fileName);
             var fileExt = Path.GetExtension(fileName);
-            var fileNameLower = fileName.ToLowerInvariant();
 
             // Check for readme/changelog files
             if (fileExt.Equals(".txt", StringComparison.OrdinalIgnoreCase))
             {
-                if (CleanupFilePatterns.Any(pattern => fileNameLower.Contains(pattern)))
+                if (fileName.AsSpan().ContainsAny(CleanupFilePatterns))
                 {
                     cleanupIssues.Add(new CleanupIssue(filePath, fileRelative, CleanupItemType.ReadmeFile));
                     continue;
@@ -390,7 +387,7 @@ public sealed class UnpackedModsScanner : IUnpackedModsScanner
             }
 
             // Check for previs/precombine files
-            if (PrevisFileSuffixes.Any(suffix => fileNameLower.EndsWith(suffix, StringComparison.OrdinalIgnoreCase)))
+            if (PrevisFileSuffixes.Any(suffix => fileName.EndsWith(suffix, StringComparison.OrdinalIgnoreCase)))
             {
                 if (reportedPrevisDirs.TryAdd(parentRelativePath, 0))
                 {
@@ -1,3 +1,4 @@
+using System.Buffers;
 using System.Security.Cryptography;
 using Microsoft.Extensions.Logging;
 using Scanner111.Common.Models.ScanGame;
@@ -18,6 +19,11 @@ namespace Scanner111.Common.Services.ScanGame;
 /// </remarks>
 public sealed class XseChecker : IXseChecker
 {
+    /// <summary>
+    /// Pattern count above which lines are pre-screened with a single multi-pattern search.
+    /// </summary>
+    private const int MultiPatternThreshold = 8;
+
     private readonly ILogger<XseChecker> _logger;
 
     /// <summary>
@@ -164,27 +170,20 @@ public sealed class XseChecker : IXseChecker
 
         var errors = new List<XseLogError>();
 
+        // With many patterns, one multi-pattern search per line rejects non-matching lines
+        // without testing each pattern individually. Empty patterns match every line, so the
+        // pre-screen is only valid when none are present.
+        var patternSearch = errorPatterns.Count > MultiPatternThreshold && !errorPatterns.Any(string.IsNullOrEmpty)
+            ? SearchValues.Create(errorPatterns.ToArray(), StringComparison.OrdinalIgnoreCase)
+            : null;
+
         try
         {
-            var lines = await File.ReadAllLinesAsync(logFilePath, cancellationToken).ConfigureAwait(false);
-
-            for (var lineNumber = 0; lineNumber < lines.Length; lineNumber++)
-            {
-                cancellationToken.ThrowIfCancellationRequested();
-
-                var line = lines[lineNumber];
-                foreach (var pattern in errorPatterns)
-                {
-                    if (line.Contains(pattern, StringComparison.OrdinalIgnoreCase))
-                    {
-                        errors.Add(new XseLogError(
-                            LineNumber: lineNumber + 1,
-                            ErrorText: line.Trim(),
-                            MatchedPattern: pattern));
-                        break; // Only report one pattern match per line
-                    }
-                }
-            }
+            // The log is small, so it is streamed synchronously on the thread pool rather than
+            // awaiting every line of an asynchronous read
+            await Task.Run(
+                () => CollectLogErrors(logFilePath, errorPatterns, patternSearch, errors, cancellationToken),
+                cancellationToken).ConfigureAwait(false);
         }
         catch (IOException ex)
         {
@@ -194,6 +193,51 @@ public sealed class XseChecker : IXseChecker
         return errors;
     }
 
+    /// <summary>
+    /// Streams an XSE log line by line and adds one <see cref="XseLogError"/> per line that
+    /// contains any of <paramref name="errorPatterns"/>. Only matching lines are kept.
+    /// </summary>
+    private static void CollectLogErrors(
+        string logFilePath,
+        IReadOnlyList<string> errorPatterns,
+        SearchValues<string>? patternSearch,
+        List<XseLogError> errors,
+        CancellationToken cancellationToken)
+    {
+        using var reader = new StreamReader(new FileStream(
+            logFilePath,
+            FileMode.Open,
+            FileAccess.Read,
+            FileShare.Read,
+            bufferSize: 4096,
+            FileOptions.SequentialScan));
+
+        var lineNumber = 0;
+        while (reader.ReadLine() is { } line)
+        {
+            cancellationToken.ThrowIfCancellationRequested();
+            lineNumber++;
+
+            if (patternSearch != null && !line.AsSpan().ContainsAny(patternSearch))
+            {
+                continue;
+            }
+
+            // Report the first configured pattern that matches, in configuration order
+            foreach (var pattern in errorPatterns)
+            {
+                if (line.Contains(pattern, StringComparison.OrdinalIgnoreCase))
+                {
+                    errors.Add(new XseLogError(
+                        LineNumber: lineNumber,
+                        ErrorText: line.Trim(),
+                        MatchedPattern: pattern));
+                    break; // Only report one pattern match per line
+                }
+            }
+        }
+    }
+
     /// <inheritdoc/>
     public async Task<IReadOnlyList<ScriptHashResult>> VerifyScriptHashesAsync(
         string scriptsFolderPath,
@@ -205,58 +249,79 @@ public sealed class XseChecker : IXseChecker
             return Array.Empty<ScriptHashResult>();
         }
 
-        var results = new List<ScriptHashResult>();
+        // Hash the scripts in parallel: each file is independent and SHA-256 is CPU-bound, so a
+        // large script set finishes in roughly one file's time per core instead of their sum.
+        // Results are written by index to keep the configured order.
+        var entries = expectedHashes.ToArray();
+        var results = new ScriptHashResult[entries.Length];
 
-        foreach (var (fileName, expectedHash) in expectedHashes)
+        var options = new ParallelOptions
         {
-            cancellationToken.ThrowIfCancellationRequested();
+            MaxDegreeOfParallelism = Environment.ProcessorCount,
+            CancellationToken = cancellationToken
+        };
 
-            var filePath = Path.Combine(scriptsFolderPath, fileName);
+        await Parallel.ForEachAsync(Enumerable.Range(0, entries.Length), options, async (index, token) =>
+        {
+            var (fileName, expectedHash) = entries[index];
+            results[index] = await VerifyScriptHashAsync(scriptsFolderPath, fileName, expectedHash, token)
+                .ConfigureAwait(false);
+        }).ConfigureAwait(false);
 
-            if (!File.Exists(filePath))
-            {
-                results.Add(new ScriptHashResult(
-                    FileName: fileName,
-                    ExpectedHash: expectedHash,
-                    ActualHash: null,
-                    Status: ScriptHashStatus.Missing));
-                continue;
-            }
+        return results;
+    }
 
-            try
-            {
-                var actualHash = await ComputeFileHashAsync(filePath, cancellationToken).ConfigureAwait(false);
-                var status = string.Equals(expectedHash, actualHash, StringComparison.OrdinalIgnoreCase)
-                    ? ScriptHashStatus.Valid
-                    : ScriptHashStatus.Mismatch;
-
-                results.Add(new ScriptHashResult(
-                    FileName: fileName,
-                    ExpectedHash: expectedHash,
-                    ActualHash: actualHash,
-                    Status: status));
-            }
-            catch (IOException ex)
-            {
-                _logger.LogWarning(ex, "Failed to read script file for hash verification: {FilePath}", filePath);
-                results.Add(new ScriptHashResult(
-                    FileName: fileName,
-                    ExpectedHash: expectedHash,
-                    ActualHash: null,
-                    Status: ScriptHashStatus.ReadError));
-            }
-            catch (UnauthorizedAccessException ex)
-            {
-                _logger.LogWarning(ex, "Access denied to script file: {FilePath}", filePath);
-                results.Add(new ScriptHashResult(
-                    FileName: fileName,
-                    ExpectedHash: expectedHash,
-                    ActualHash: null,
-                    Status: ScriptHashStatus.ReadError));
-            }
+    /// <summary>
+    /// Verifies a single script file against its expected hash.
+    /// </summary>
+    private async Task<ScriptHashResult> VerifyScriptHashAsync(
+        string scriptsFolderPath,
+        string fileName,
+        string expectedHash,
+        CancellationToken cancellationToken)
+    {
+        var filePath = Path.Combine(scriptsFolderPath, fileName);
+
+        if (!File.Exists(filePath))
+        {
+            return new ScriptHashResult(
+                FileName: fileName,
+                ExpectedHash: expectedHash,
+                ActualHash: null,
+                Status: ScriptHashStatus.Missing);
         }
 
-        return results;
+        try
+        {
+            var actualHash = await ComputeFileHashAsync(filePath, cancellationToken).ConfigureAwait(false);
+            var status = string.Equals(expectedHash, actualHash, StringComparison.OrdinalIgnoreCase)
+                ? ScriptHashStatus.Valid
+                : ScriptHashStatus.Mismatch;
+
+            return new ScriptHashResult(
+                FileName: fileName,
+                ExpectedHash: expectedHash,
+                ActualHash: actualHash,
+                Status: status);
+        }
+        catch (IOException ex)
+        {
+            _logger.LogWarning(ex, "Failed to read script file for hash verification: {FilePath}", filePath);
+            return new ScriptHashResult(
+                FileName: fileName,
+                ExpectedHash: expectedHash,
+                ActualHash: null,
+                Status: ScriptHashStatus.ReadError);
+        }
+        catch (UnauthorizedAccessException ex)
+        {
+            _logger.LogWarning(ex, "Access denied to script file: {FilePath}", filePath);
+            return new ScriptHashResult(
+                FileName: fileName,
+                ExpectedHash: expectedHash,
+                ActualHash: null,
+                Status: ScriptHashStatus.ReadError);
+        }
     }
 
     /// <summary>
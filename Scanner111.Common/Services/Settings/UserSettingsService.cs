@@ -19,7 +19,7 @@ public class UserSettingsService : IUserSettingsService
 
     private readonly string _settingsFilePath;
     private readonly SemaphoreSlim _lock = new(1, 1);
-    private UserSettings? _cachedSettings;
+    private volatile UserSettings? _cachedSettings;
 
     /// <summary>
     /// Initializes a new instance of the <see cref="UserSettingsService"/> class.
@@ -39,6 +39,21 @@ public class UserSettingsService : IUserSettingsService
     public async Task<UserSettings> LoadAsync(CancellationToken ct = default)
     {
         await _lock.WaitAsync(ct).ConfigureAwait(false);
+        try
+        {
+            return await LoadCoreAsync(ct).ConfigureAwait(false);
+        }
+        finally
+        {
+            _lock.Release();
+        }
+    }
+
+    /// <summary>
+    /// Reads the settings file into the cache. Callers must hold <see cref="_lock"/>.
+    /// </summary>
+    private async Task<UserSettings> LoadCoreAsync(CancellationToken ct)
+    {
         try
         {
             if (!File.Exists(_settingsFilePath))
@@ -60,10 +75,6 @@ public class UserSettingsService : IUserSettingsService
             _cachedSettings = UserSettings.Default;
             return _cachedSettings;
         }
-        finally
-        {
-            _lock.Release();
-        }
     }
 
     /// <inheritdoc/>
@@ -95,12 +106,22 @@ public class UserSettingsService : IUserSettingsService
     /// <inheritdoc/>
     public async Task<UserSettings> GetCurrentAsync(CancellationToken ct = default)
     {
-        if (_cachedSettings is not null)
+        // Fast path: once loaded, the cached settings are returned without touching the lock
+        if (_cachedSettings is { } cached)
         {
-            return _cachedSettings;
+            return cached;
         }
 
-        return await LoadAsync(ct).ConfigureAwait(false);
+        await _lock.WaitAsync(ct).ConfigureAwait(false);
+        try
+        {
+            // Another caller may have loaded the settings while this one waited for the lock
+            return _cachedSettings ?? await LoadCoreAsync(ct).ConfigureAwait(false);
+        }
+        finally
+        {
+            _lock.Release();
+        }
     }
 
     /// <inheritdoc/>
@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.IO;
 using System.Linq;
@@ -104,25 +105,15 @@ public class BackupService : IBackupService
                         StringComparer.OrdinalIgnoreCase)
                     : new HashSet<string>(StringComparer.OrdinalIgnoreCase);
 
-                foreach (var file in gameFiles)
-                {
-                    ct.ThrowIfCancellationRequested();
-                    var fileName = Path.GetFileName(file);
-
-                    if (MatchesPattern(fileName, patterns) && !existingBackups.Contains(fileName))
+                var filesToCopy = gameFiles
+                    .Where(file =>
                     {
-                        try
-                        {
-                            var destPath = Path.Combine(categoryBackupPath, fileName);
-                            File.Copy(file, destPath, overwrite: true);
-                            filesBackedUp++;
-                        }
-                        catch (Exception ex)
-                        {
-                            errors.Add($"{fileName}: {ex.Message}");
-                        }
-                    }
-                }
+                        var fileName = Path.GetFileName(file);
+                        return MatchesPattern(fileName, patterns) && !existingBackups.Contains(fileName);
+                    })
+                    .ToList();
+
+                filesBackedUp = CopyFilesConcurrently(filesToCopy, categoryBackupPath, errors, ct);
             }
             catch (OperationCanceledException)
             {
@@ -164,22 +155,7 @@ public class BackupService : IBackupService
             {
                 var backupFiles = Directory.GetFiles(categoryBackupPath);
 
-                foreach (var file in backupFiles)
-                {
-                    ct.ThrowIfCancellationRequested();
-                    var fileName = Path.GetFileName(file);
-
-                    try
-                    {
-                        var destPath = Path.Combine(GameFolderPath, fileName);
-                        File.Copy(file, destPath, overwrite: true);
-                        filesRestored++;
-                    }
-                    catch (Exception ex)
-                    {
-                        errors.Add($"{fileName}: {ex.Message}");
-                    }
-                }
+                filesRestored = CopyFilesConcurrently(backupFiles, GameFolderPath, errors, ct);
             }
             catch (OperationCanceledException)
             {
@@ -275,6 +251,46 @@ public class BackupService : IBackupService
         return Directory.Exists(categoryPath) && Directory.EnumerateFiles(categoryPath).Any();
     }
 
+    /// <summary>
+    /// Copies files into the destination folder in parallel, so the total time is bounded by
+    /// the slowest copies rather than the sum of all of them. Per-file failures are recorded in
+    /// <paramref name="errors"/>; returns the number of files copied successfully.
+    /// </summary>
+    private static int CopyFilesConcurrently(
+        IReadOnlyList<string> sourceFiles,
+        string destinationFolder,
+        List<string> errors,
+        CancellationToken ct)
+    {
+        var copied = 0;
+        var copyErrors = new ConcurrentBag<string>();
+
+        var options = new ParallelOptions
+        {
+            MaxDegreeOfParallelism = Environment.ProcessorCount,
+            CancellationToken = ct
+        };
+
+        Parallel.ForEach(sourceFiles, options, file =>
+        {
+            var fileName = Path.GetFileName(file);
+
+            try
+            {
+                var destPath = Path.Combine(destinationFolder, fileName);
+                File.Copy(file, destPath, overwrite: true);
+                Interlocked.Increment(ref copied);
+            }
+            catch (Exception ex)
+            {
+                copyErrors.Add($"{fileName}: {ex.Message}");
+            }
+        });
+
+        errors.AddRange(copyErrors);
+        return copied;
+    }
+
     private static bool MatchesPattern(string fileName, string[] patterns)
     {
         return patterns.Any(pattern =>
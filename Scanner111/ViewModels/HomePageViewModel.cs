@@ -201,7 +201,8 @@ public class HomePageViewModel : ViewModelBase
             ScanPath = CustomScanPath,
             FcxMode = _settingsService.FcxMode,
             ShowFormIdValues = _settingsService.ShowFormIdValues,
-            MaxConcurrent = _settingsService.MaxConcurrent
+            MaxConcurrent = _settingsService.MaxConcurrent,
+            RetainReports = true
         };
 
         var progressReporter = new Progress<ScanProgress>(p =>
@@ -218,11 +219,13 @@ public class HomePageViewModel : ViewModelBase
         {
             var result = await _scanExecutor.ExecuteScanAsync(config, progressReporter);
 
+            // RetainReports makes the executor keep each processed file's report, so results are
+            // shown from memory instead of reading the AUTOSCAN files just written back from disk
             foreach (var processedFile in result.ProcessedFiles)
             {
-                // Try to load actual AUTOSCAN content
-                var autoscanPath = GetAutoscanPath(processedFile);
-                var content = await LoadAutoscanContentAsync(autoscanPath, processedFile);
+                var content = result.Reports.TryGetValue(processedFile, out var report)
+                    ? string.Join('\n', report.Lines)
+                    : $"# {Path.GetFileName(processedFile)}\n\nAnalysis completed, but the report is unavailable.";
 
                 ScanResults.Add(new LogAnalysisResultDisplay
                 {
@@ -255,33 +258,6 @@ public class HomePageViewModel : ViewModelBase
         }
     }
 
-    private static string GetAutoscanPath(string logFilePath)
-    {
-        // AUTOSCAN files are typically named like: crash-name-AUTOSCAN.md
-        var directory = Path.GetDirectoryName(logFilePath) ?? string.Empty;
-        var fileName = Path.GetFileNameWithoutExtension(logFilePath);
-        return Path.Combine(directory, $"{fileName}-AUTOSCAN.md");
-    }
-
-    private static async Task<string> LoadAutoscanContentAsync(string autoscanPath, string originalLogPath)
-    {
-        if (File.Exists(autoscanPath))
-        {
-            try
-            {
-                return await File.ReadAllTextAsync(autoscanPath);
-            }
-            catch
-            {
-                // Fall through to default content
-            }
-        }
-
-        // Default content if AUTOSCAN file doesn't exist
-        return
-            $"# {Path.GetFileName(originalLogPath)}\n\nAnalysis completed. AUTOSCAN file not found at:\n`{autoscanPath}`";
-    }
-
     private void OpenCrashLogsFolder()
     {
         if (!string.IsNullOrWhiteSpace(CustomScanPath) && Directory.Exists(CustomScanPath))